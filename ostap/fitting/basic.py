@@ -2302,6 +2302,22 @@ class Fit1D (PDF) :
     >>> gauss = Gauss_pdf( ... ) 
     >>> pdf   = Fit1D ( signal = gauss , background = 0 ) ## Gauss as signal ans exponent as background 
     """
+    ## keep the (many) private attributes out of the instance dictionary
+    __slots__ = ( '__args'                 ,
+                  '__suffix'               , '__recursive'           , '__extended'        ,
+                  '__combine_signals'      , '__combine_backgrounds' , '__combine_others'  ,
+                  '__args_S'               , '__args_B'              ,
+                  '__args_C'               , '__args_F'              ,
+                  '__signal'               , '__background'          , '__other'           ,
+                  '__save_signal'          , '__save_background'     ,
+                  '__more_signals'         , '__more_backgrounds'    , '__more_components' ,
+                  '__all_signals'          , '__all_backgrounds'     , '__all_components'  ,
+                  '__sigs'                 , '__bkgs'                ,
+                  '__signal_fractions'     , '__background_fractions', 
+                  '__components_fractions' ,
+                  '__nums_signals'         , '__nums_backgrounds'    ,
+                  '__nums_components'      , '__nums_fractions'      )
+    
     def __init__ ( self                          , 
                    signal                        ,    ## the main signal 
                    background          = None    ,    ## the main background 
@@ -2371,41 +2387,14 @@ class Fit1D (PDF) :
         self.backgrounds .add ( self.__background .pdf )
 
         #
-        ## treat additional signals
+        ## treat additional signals, backgrounds and components
         #        
         self.__more_signals       = [] 
-        for c in othersignals :
-            if   isinstance ( c , PDF            ) : cc = c 
-            elif isinstance ( c , ROOT.RooAbsPdf ) : cc = Generic1D_pdf ( c ,  self.xvar ) 
-            else :
-                self.error ('unknown signal component %s/%s, skip it!' % ( c , type ( c ) ) )
-                continue  
-            self.__more_signals.append ( cc     )
-            self.signals.add           ( cc.pdf ) 
-        #
-        ## treat additional backgounds 
-        #
         self.__more_backgrounds   = [] 
-        for c in otherbackgrounds :
-            if   isinstance ( c , PDF            ) : cc = c  
-            elif isinstance ( c , ROOT.RooAbsPdf ) : cc = Generic1D_pdf ( cs ,  self.xvar ) 
-            else :
-                self.error ('unknown background component %s/%s, skip it!' % ( c , type ( c ) ) )
-                continue  
-            self.__more_backgrounds.append ( cc     )
-            self.backgrounds.add           ( cc.pdf ) 
-        #
-        ## treat additional components
-        #
         self.__more_components    = []
-        for c in others : 
-            if   isinstance ( c , PDF            ) : cc = c  
-            elif isinstance ( c , ROOT.RooAbsPdf ) : cc = Generic1D_pdf ( cs ,  self.xvar ) 
-            else :
-                self.error ("unknown ``other''component %s/%s, skip it!" % ( c , type ( c ) ) )
-                continue  
-            self.__more_components.append ( cc     )
-            self.components.add           ( cc.pdf ) 
+        self.__ingest ( othersignals     , self.__more_signals     , self.signals     , 'signal'     )
+        self.__ingest ( otherbackgrounds , self.__more_backgrounds , self.backgrounds , 'background' )
+        self.__ingest ( others           , self.__more_components  , self.components  , "``other''"  )
 
         # =====================================================================
         ## build PDF
@@ -2481,7 +2470,7 @@ class Fit1D (PDF) :
                 self.__nums_signals.append ( sf ) 
             elif 2 <= ns : 
                 fis = self.make_fracs ( ns , 'S%s_%%d' % suffix ,  'S%s_%%d'  % suffix , fractions  = False , fracs = S )
-                for s in self.__all_signals : self.alist1.add ( s )
+                self.alist1.add ( self.__all_signals )
                 for f in fis                : self.__nums_signals.append ( f ) 
 
             nb = len ( self.__all_backgrounds )
@@ -2491,7 +2480,7 @@ class Fit1D (PDF) :
                 self.__nums_backgrounds.append ( bf ) 
             elif 2 <= nb :
                 fib = self.make_fracs ( nb , 'B%s_%%d' % suffix ,  'B%s_%%d'  % suffix , fractions  = False , fracs = B )
-                for b in self.__all_backgrounds : self.alist1.add ( b )
+                self.alist1.add ( self.__all_backgrounds )
                 for f in fib                    : self.__nums_backgrounds.append ( f ) 
 
             nc = len ( self.__all_components )
@@ -2501,7 +2490,7 @@ class Fit1D (PDF) :
                 self.__nums_components.append ( cf ) 
             elif 2 <= nc : 
                 fic = self.make_fracs ( nc , 'C%s_%%d' % suffix ,  'C%s_%%d'  % suffix , fractions  = False , fracs = C )
-                for c in self.__all_components : self.alist1.add ( c )
+                self.alist1.add ( self.__all_components )
                 for f in fic                   : self.__nums_components.append ( f )
 
             for s in self.__nums_signals     : self.alist2.add ( s ) 
@@ -2518,9 +2507,10 @@ class Fit1D (PDF) :
             nb = len ( self.__all_backgrounds )
             nc = len ( self.__all_components  )
             
-            for s in self.__all_signals     : self.alist1.add ( s )
-            for b in self.__all_backgrounds : self.alist1.add ( b )
-            for c in self.__all_components  : self.alist1.add ( c )
+            ## bulk (C++-side) copy of the collections
+            self.alist1.add ( self.__all_signals     )
+            self.alist1.add ( self.__all_backgrounds )
+            self.alist1.add ( self.__all_components  )
 
             fic = self.make_fracs ( ns + nb + nc , 'f%s_%%d' % suffix , 'f%s_%%d'  % suffix ,
                                     fractions  = True , recursive = self.recursive , fracs = F )
@@ -2553,8 +2543,52 @@ class Fit1D (PDF) :
             self.debug ( "non-extended model ``%s'' with %s/%s components"  % ( self.pdf.GetName() , len( self.alist1) , len(self.alist2) ) )
 
 
-        ## save the configurtaion
-        self.config = {
+    # =========================================================================
+    ## add the additional components to the list and to the collection 
+    #  - bare RooFit PDFs are wrapped into <code>Generic1D_pdf</code>
+    #  - components of unknown types are skipped 
+    def __ingest ( self , components , target , destination , label ) :
+        """Add the additional components to the list and to the collection:
+        - bare RooFit PDFs are wrapped into Generic1D_pdf
+        - components of unknown types are skipped 
+        """
+        for c in components :
+            if   isinstance ( c , PDF            ) : cc = c 
+            elif isinstance ( c , ROOT.RooAbsPdf ) : cc = Generic1D_pdf ( c ,  self.xvar ) 
+            else :
+                self.error ('unknown %s component %s/%s, skip it!' % ( label , c , type ( c ) ) )
+                continue  
+            target.append   ( cc     )
+            destination.add ( cc.pdf ) 
+
+    # =========================================================================
+    ## assign the values to yields/fractions
+    #  @param nums   the yields/fractions 
+    #  @param value  the value(s) to be assigned 
+    def __set_nums ( self , nums , value ) :
+        """Assign the values to yields/fractions
+        - nums   : the yields/fractions 
+        - value  : the value(s) to be assigned 
+        """
+        
+        if   isinstance ( value , num_types          ) : value = [ value           ]
+        elif isinstance ( value , VE                 ) : value = [ value.value()   ]
+        elif isinstance ( value , ROOT.RooAbsReal    ) : value = [ float ( value ) ] 
+        elif isinstance ( value , list_types         ) : pass
+        elif isinstance ( value , ROOT.RooArgList    ) : pass
+
+        for s , v in zip ( nums , value ) :
+
+            vv = float ( v  )
+            mm = s.minmax() 
+            if mm and not vv in s :
+                logger.error ("Value %s is outside the allowed region %s"  % ( vv , mm ) ) 
+            s.setVal   ( vv ) 
+            
+    @property
+    def config ( self ) :
+        """The full configuration info for the PDF (built on demand)"""
+        return {
             'signal'              : self.save_signal         ,
             'background'          : self.save_background     ,
             'othersignals'        : self.more_signals        ,
@@ -2564,15 +2598,19 @@ class Fit1D (PDF) :
             'name'                : self.name                ,
             'extended'            : self.extended            ,
             'combine_signals'     : self.combine_signals     ,
-            'combine_backrgounds' : self.combine_backgrounds ,
+            'combine_backgrounds' : self.combine_backgrounds ,
             'combine_others'      : self.combine_others      ,
             'recursive'           : self.recursive           ,
             'xvar'                : self.xvar                ,
-            'S'                   : S                        ,
-            'B'                   : B                        ,
-            'C'                   : C                        ,
-            'F'                   : F                        ,            
+            'S'                   : self.__args_S            ,
+            'B'                   : self.__args_B            ,
+            'C'                   : self.__args_C            ,
+            'F'                   : self.__args_F            ,            
             }
+    @config.setter
+    def config ( self , value ) :
+        ## nothing to store: configuration is (re)built from the actual attributes
+        pass 
         
     @property
     def extended ( self ) :
@@ -2675,21 +2713,7 @@ class Fit1D (PDF) :
         ns = len ( self.__nums_signals )
         assert 1 <= ns , "No signals are defined, assignement is impossible"
         
-        ##
-        if   isinstance ( value , num_types          ) : value = [ value           ]
-        elif isinstance ( value , VE                 ) : value = [ value.value()   ]
-        elif isinstance ( value , ROOT.RooAbsReal    ) : value = [ float ( value ) ] 
-        elif isinstance ( value , list_types         ) : pass
-        elif isinstance ( value , ROOT.RooArgList    ) : pass
-
-        ss = [ self.S ] if 1 == ns else self.S
-
-        for s , v in zip ( ss , value ) :
-
-            vv = float ( v  )
-            if s.minmax() and not vv in s :
-                logger.error ("Value %s is outside the allowed region %s"  % ( vv , s.minmax() ) ) 
-            s.setVal   ( vv ) 
+        self.__set_nums ( self.__nums_signals , value )
     
     @property
     def B ( self ) :
@@ -2714,20 +2738,7 @@ class Fit1D (PDF) :
         nb = len ( self.__nums_backgrounds )
         assert 1 <= nb , "No backgrounds are defined, assignement is impossible"
 
-        if   isinstance ( value , num_types          ) : value = [ value           ]
-        elif isinstance ( value , VE                 ) : value = [ value.value()   ]
-        elif isinstance ( value , ROOT.RooAbsReal    ) : value = [ float ( value ) ] 
-        elif isinstance ( value , list_types         ) : pass
-        elif isinstance ( value , ROOT.RooArgList    ) : pass
-
-        ss = [ self.B ] if 1 == nb else self.B
-
-        for s , v in zip ( ss , value ) :
-
-            vv = float ( v  )
-            if s.minmax() and not vv in s :
-                logger.error ("Value %s is outside the allowed region %s"  % ( vv  , s.minmax() ) ) 
-            s.setVal   ( vv ) 
+        self.__set_nums ( self.__nums_backgrounds , value )
 
     @property
     def C ( self ) :
@@ -2752,20 +2763,7 @@ class Fit1D (PDF) :
         nc = len ( self.__nums_components )
         assert 1 <= nc , "No ``other'' components are defined, assignement is impossible"
 
-        if   isinstance ( value , num_types          ) : value = [ value           ]
-        elif isinstance ( value , VE                 ) : value = [ value.value()   ]
-        elif isinstance ( value , ROOT.RooAbsReal    ) : value = [ float ( value ) ] 
-        elif isinstance ( value , list_types         ) : pass
-        elif isinstance ( value , ROOT.RooArgList    ) : pass
-
-        ss = [ self.C ] if 1 == nc else self.C
-
-        for s , v in zip ( ss , value ) :
-
-            vv = float ( v  )
-            if s.minmax() and not vv in s :
-                logger.error("Value %s is outside the allowed region %s"  % ( vv , s.minmax() ) ) 
-            s.setVal   ( vv ) 
+        self.__set_nums ( self.__nums_components , value )
 
     @property 
     def F ( self ) :
@@ -2789,19 +2787,7 @@ class Fit1D (PDF) :
         nf = len ( self.__nums_fractions )
         assert 1 <= nf , "No fractions are defined, assignement is impossible"
 
-        ss = [ self.F ] if 1 == nf else self.F
-        if   isinstance ( value , num_types          ) : value = [ value           ]
-        elif isinstance ( value , VE                 ) : value = [ value.value()   ]
-        elif isinstance ( value , ROOT.RooAbsReal    ) : value = [ float ( value ) ] 
-        elif isinstance ( value , list_types         ) : pass
-        elif isinstance ( value , ROOT.RooArgList    ) : pass
-
-        for s , v in zip ( ss , value ) :
-
-            vv = float ( v  )
-            if s.minmax() and not vv in s :
-                logger.error ("Value %s is outside the allowed region %s"  % ( vv , s.minmax() ) ) 
-            s.setVal   ( vv ) 
+        self.__set_nums ( self.__nums_fractions , value )
 
     @property
     def  yields    ( self ) :
@@ -2813,10 +2799,10 @@ class Fit1D (PDF) :
         if not self.extended    : return None 
         if not self.fit_result                                 : return None
         if not valid_pointer ( self.fit_result )               : return None
-        yields = self.yields
+        yields = self.alist2
         if not yields                                          : return None
         if 1 ==  len ( yields )                                : return yields[0].value  
-        return self.fit_result.sum ( *yields ) 
+        return self.fit_result.sum ( yields ) 
  
     @property
     def  fractions ( self ) :
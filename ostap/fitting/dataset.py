@@ -21,13 +21,15 @@ __all__     = (
     'useStorage' , ## define (as context) the default storage for  RooDataStore
     'ds_draw'    , ## draw varibales from RooDataSet 
     'ds_project' , ## project variables from RooDataSet to histogram 
+    'invalidate_tty_cache' , ## invalidate the cached ``isatty'' for printout of datasets 
     )
 # =============================================================================
-import ROOT, random
+import ROOT, random, array, re, operator
 from   ostap.core.core import Ostap, VE, hID, dsID , valid_pointer  
 import ostap.fitting.variables 
 import ostap.fitting.roocollections
 import ostap.fitting.printable
+from   ostap.utils.basic import terminal_size, isatty 
 # =============================================================================
 # logging 
 # =============================================================================
@@ -69,21 +71,119 @@ def _rad_getitem_ ( self , i ) :
     >>> events = dataset[0:1000]
     >>> events = dataset[0:-1:10]
     """
-    if   isinstance ( i , slice ) :
+    if   isinstance ( i , ( int , long ) ) :
+        if 0 <= i < len ( self ) : return self.get ( i )
+        
+    elif isinstance ( i , slice ) :
         
         start , stop , step = i.indices ( len ( self ) )
                               
         if 1 == step : return self.reduce ( ROOT.RooFit.EventRange ( start , stop ) )
         
-        result = self.emptyClone( dsID() )
-        for j in xrange ( start , stop , step ) : result.add ( self [j] ) 
-        return result
-    
-    elif isinstance ( i , ( int , long ) ) and 0<= i < len ( self ) :
-        return self.get ( i )
+        return _rad_subset_ ( self , xrange ( start , stop , step ) )
     
     raise IndexError ( 'Invalid index %s'% i )
 
+# =============================================================================
+## the helper C++ functions to copy the selected entries and to shuffle indices
+_subset_  = getattr ( Ostap.Utils , 'subset'  , None )
+_shuffle_ = getattr ( Ostap.Utils , 'shuffle' , None )
+_select_  = getattr ( Ostap.Utils , 'select'  , None )
+_sort_    = getattr ( Ostap.Utils , 'sort'    , None )
+_fill_    = getattr ( Ostap.Utils , 'fill'    , None )
+# =============================================================================
+## get the random sample of <code>num</code> indices from <code>[0,n)</code>
+#  (without replacement) in a form of <code>array.array('L')</code>
+#  - for <code>num</code> equal or larger than <code>n</code> the
+#    random permutation of all indices is returned  
+#  - the indices are shuffled in C++ (if possible)
+#    with the seed taken from the standard <code>random</code> module 
+#  @see Ostap::Utils::shuffle 
+def _random_indices_ ( n , num ) :
+    """Get the random sample of ``num'' indices from [0,n) (without replacement)
+    - for ``num'' equal or larger than ``n'' the random permutation of all indices is returned
+    - the indices are shuffled in C++ (if possible)
+    with the seed taken from the standard ``random'' module 
+    """
+    if _shuffle_ :
+        indices = array.array ( 'L' , xrange ( n ) )
+        _shuffle_ ( indices , n , num , random.getrandbits ( 32 ) )
+        return indices [ : num ] if num < n else indices
+    
+    if num < n : return array.array ( 'L' , random.sample ( xrange ( n ) , num ) )
+    
+    indices = array.array ( 'L' , xrange ( n ) )
+    random.shuffle ( indices )
+    return indices 
+# =============================================================================
+## get the random (Bernoulli) selection of indices from <code>[0,n)</code>:
+#  each index is selected with the probability <code>fraction</code>
+#  - the indices are selected in C++ (if possible)
+#    with the seed taken from the standard <code>random</code> module 
+#  @see Ostap::Utils::select 
+def _bernoulli_indices_ ( n , fraction ) :
+    """Get the random (Bernoulli) selection of indices from [0,n):
+    each index is selected with the probability ``fraction''
+    - the indices are selected in C++ (if possible)
+    with the seed taken from the standard ``random'' module 
+    """
+    if _select_ :
+        indices = array.array ( 'L' , [ 0 ] ) * n 
+        num     = _select_ ( indices , n , fraction , random.getrandbits ( 32 ) )
+        return indices [ : num ]
+    
+    rnd = random.random 
+    return array.array ( 'L' , ( i for i in xrange ( n ) if rnd () < fraction ) )
+
+# =============================================================================
+## get the subset of dataset for the given sequence of indices
+#  @code
+#  dataset = ...
+#  subset  = _rad_subset_ ( dataset , [ 1 , 5 , 10 ] ) 
+#  @endcode
+#  The entries are copied in C++ (if possible) 
+#  @see Ostap::Utils::subset 
+def _rad_subset_ ( self , indices ) :
+    """Get the subset of dataset for the given sequence of indices
+    >>> dataset = ...
+    >>> subset  = _rad_subset_ ( dataset , [ 1 , 5 , 10 ] ) 
+    """
+    result = self.emptyClone ( dsID () )
+    if not indices : return result
+    
+    if _subset_ :
+        if isinstance ( indices , array.array ) and 'L' == indices.typecode :
+            buffer = indices
+        else :
+            buffer = array.array ( 'L' , indices )
+        _subset_ ( self , result , buffer , len ( buffer ) )
+    else :
+        add , get , weight = result.add , self.get , self.weight 
+        for i in indices : add ( get ( i ) , weight () )
+        
+    return result
+    
+# =============================================================================
+## Get variables in form of RooArgSet (cached)
+#  @code
+#  dataset = ...
+#  varset  = dataset.varset() 
+#  @endcode
+#  @attention RooAbsData::get() returns the pointer to the data member,
+#  that is the same for the whole life of the dataset (new columns are added
+#  into the same collection), therefore it can be safely cached
+def _rad_varset_ ( self ) :
+    """Get variables in form of RooArgSet (cached)
+    >>> dataset = ...
+    >>> varset  = dataset.varset() 
+    """
+    d    = self.__dict__
+    vset = d.get ( '_cached_varset' , None )
+    if vset is None :
+        vset = self.get()
+        d [ '_cached_varset' ] = vset
+    return vset
+
 # =============================================================================
 ## Get variables in form of RooArgList 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -91,8 +191,13 @@ def _rad_getitem_ ( self , i ) :
 def _rad_vlist_ ( self ) :
     """Get variables in form of RooArgList 
     """
+    vset     = _rad_varset_ ( self ) 
+    try :
+        return ROOT.RooArgList ( vset ) ## copy in C++ 
+    except TypeError :
+        pass
+    # 
     vlst     = ROOT.RooArgList()
-    vset     = self.get()
     for v in vset : vlst.add ( v )
     #
     return vlst
@@ -105,7 +210,7 @@ def _rad_contains_ ( self , aname ) :
     """Check the presence of variable in dataset    
     >>> if 'mass' in dataset : print 'ok!'
     """
-    vset = self.get()
+    vset = _rad_varset_ ( self ) 
     return aname in vset 
 
 # =============================================================================
@@ -148,6 +253,7 @@ def _rad_add_ ( self , another ) :
             result = self.emptyClone( dsID() ) 
             result.append ( self    )
             result.append ( another )
+            return result 
     
     return NotImplemented
 
@@ -200,11 +306,7 @@ def _rad_mul_ ( self , another ) :
     fraction = another    
     if  isinstance ( fraction , float ) and 0 < fraction < 1 :
 
-        res = self.emptyClone()
-        l    = len ( self )
-        for i in xrange ( l ) :
-            if random.uniform(0,1) < fraction : res.add ( self[i] ) 
-        return res
+        return _rad_subset_ ( self , _bernoulli_indices_ ( len ( self ) , fraction ) )
     
     elif 1 == fraction : return self.clone      ()
     elif 0 == fraction : return self.emptyClone () 
@@ -243,11 +345,8 @@ def  _rad_mod_ ( self , fraction ) :
     """
     if  isinstance ( fraction , ( int , long ) ) and 1 < fraction :
 
-        res = self.emptyClone()
         s    = slice ( 0 , -1 , fraction )
-        for i in xrange ( *s.indices ( len ( self ) ) ) : 
-            res.add ( self[i] ) 
-        return res 
+        return _rad_subset_ ( self , xrange ( *s.indices ( len ( self ) ) ) )
         
     elif 1 == fraction : return self.clone      ()
 
@@ -267,24 +366,23 @@ def _rad_sample_ ( self , num ) :
     >>> subset =  data.sample ( 100  )  ## get 100   events 
     >>> subset =  data.sample ( 0.01 )  ## get 1% of events 
     """
+    n = len ( self )
     if   0 == num : return self.emptyClone ( dsID () ) 
     elif isinstance ( num , (  int , long ) ) and 0 < num :
-        num = min ( num , len ( self ) )
+        num = min ( num , n )
     elif isinstance ( num , float ) and 0 < num < 1 :
         from ostap.math.random_ext import poisson 
-        num = poisson ( num * len ( self ) )
+        num = poisson ( num * n )
         return _rad_sample_ ( self , num )
     else :
         raise TypeError("Unknown ``num''=%s" % num )
     
-    result  = self.emptyClone ( dsID () )
-    indices = random.sample (  xrange ( len ( self ) ) , num )
+    indices = _random_indices_ ( n , num )
+    ## sequential access
+    if _sort_ : _sort_ ( indices , len ( indices ) ) 
+    else      : indices = array.array ( 'L' , sorted ( indices ) )  
     
-    while indices :
-        i = indices.pop()
-        result.add ( self[i] )
-        
-    return result 
+    return _rad_subset_ ( self , indices )
 
 # =============================================================================
 ## get the shuffled sample
@@ -297,16 +395,10 @@ def _rad_shuffle_ ( self ) :
     >>> data = ....
     >>> shuffled = data.shuffle()
     """
-    result  = self.emptyClone ( dsID () )
-    
-    indices = [ i for i in xrange( len ( self ) ) ]  
-    random.shuffle ( indices )
+    n       = len ( self )
+    indices = _random_indices_ ( n , n )
 
-    while indices :
-        i = indices.pop()
-        result.add ( self[i] )
-        
-    return result 
+    return _rad_subset_ ( self , indices )
     
 # =============================================================================
 ## some decoration over RooDataSet 
@@ -314,7 +406,7 @@ ROOT.RooAbsData . varlist       = _rad_vlist_
 ROOT.RooAbsData . varlst        = _rad_vlist_
 ROOT.RooAbsData . vlist         = _rad_vlist_
 ROOT.RooAbsData . vlst          = _rad_vlist_
-ROOT.RooAbsData . varset        = lambda s : s.get()
+ROOT.RooAbsData . varset        = _rad_varset_
 
 ROOT.RooAbsData . __len__       = lambda s   : s.numEntries()
 ROOT.RooAbsData . __nonzero__   = lambda s   : 0 != len ( s ) 
@@ -335,12 +427,28 @@ ROOT.RooAbsData . __mod__       = _rad_mod_
 ROOT.RooAbsData . sample        = _rad_sample_
 ROOT.RooAbsData . shuffle       = _rad_shuffle_
 
-from ostap.trees.trees import _stat_var_, _stat_cov_ , _stat_covs_ , _sum_var_, _sum_var_old_
-ROOT.RooAbsData . sumVar        = _sum_var_ 
-ROOT.RooAbsData . sumVar_       = _sum_var_old_ 
-ROOT.RooAbsData . statVar       = _stat_var_ 
-ROOT.RooAbsData . statCov       = _stat_cov_ 
-ROOT.RooAbsData . statCovs      = _stat_covs_ 
+# =============================================================================
+## create the method, that imports the actual implementation from
+#  <code>ostap.trees.trees</code> at the first call and rebinds itself to it
+#  (the import of <code>ostap.trees.trees</code> is deferred until it is needed)
+def _lazy_trees_method_ ( attr , fname ) :
+    """Create the method, that imports the actual implementation from
+    ostap.trees.trees at the first call and rebinds itself to it
+    """
+    def _method_ ( self , *args , **kwargs ) :
+        import ostap.trees.trees 
+        method = getattr ( ostap.trees.trees , fname )
+        setattr ( ROOT.RooAbsData , attr , method )
+        return method ( self , *args , **kwargs )
+    _method_.__name__ = fname 
+    return _method_ 
+
+ROOT.RooAbsData . sumVar        = _lazy_trees_method_ ( 'sumVar'   , '_sum_var_'     ) 
+ROOT.RooAbsData . sumVar_       = _lazy_trees_method_ ( 'sumVar_'  , '_sum_var_old_' ) 
+ROOT.RooAbsData . statVar       = _lazy_trees_method_ ( 'statVar'  , '_stat_var_'    ) 
+ROOT.RooAbsData . statVars      = _lazy_trees_method_ ( 'statVars' , '_stat_vars_'   ) 
+ROOT.RooAbsData . statCov       = _lazy_trees_method_ ( 'statCov'  , '_stat_cov_'    ) 
+ROOT.RooAbsData . statCovs      = _lazy_trees_method_ ( 'statCovs' , '_stat_covs_'   ) 
 
 
 _new_methods_ += [
@@ -369,6 +477,7 @@ _new_methods_ += [
    ROOT.RooAbsData . shuffle       ,
    #
    ROOT.RooAbsData . statVar       ,
+   ROOT.RooAbsData . statVars      ,
    ROOT.RooAbsData . sumVar        ,
    ROOT.RooAbsData . sumVar_       ,
    #
@@ -379,6 +488,59 @@ _new_methods_ += [
 
 
 
+# =============================================================================
+## TTreeFormula constructions that are invalid or have different meaning in C++
+#  (power, special variables, array indices, integer division of literals) 
+_formula_only_ = re.compile ( r'\^|\*\*|\$|@|\[|\bEntry\b|\b\d+\s*/\s*\d+\b' )
+# =============================================================================
+## Project the TTree-based storage via DataFrame:
+#  the expressions are JIT-compiled once and the columns are read in bulk,
+#  instead of the entry-by-entry <code>TTree::Project</code>
+#  @code
+#  tree = dataset.store().tree() 
+#  sc   = _frame_project_ ( tree , histo , 'y:x' , 'pt>1' )
+#  @endcode
+#  @return status code or <code>None</code> if the case is not supported
+#  @see Ostap::HistoProject
+def _frame_project_ ( tree , histo , what , cuts ) :
+    """Project the TTree-based storage via DataFrame:
+    the expressions are JIT-compiled once and the columns are read in bulk
+    - return status code or None if the case is not supported
+    """
+    if not isinstance ( histo , ROOT.TH1 ) : return None 
+    if ';' in what or ( ',' in what and not '(' in what ) : return None 
+    ## DataFrame expressions are C++, not TTreeFormula 
+    if _formula_only_.search ( what ) or _formula_only_.search ( cuts ) : return None 
+    
+    vars = [ v.strip() for v in what.split(':') ]
+    if not all ( vars ) : return None 
+
+    try : 
+        from ostap.frames.frames import DataFrame
+    except ( ImportError , AttributeError ) :
+        return None
+
+    try :
+        frame = DataFrame ( tree )
+        ## reset it!
+        histo.Reset() 
+        sc    = None 
+        if   isinstance ( histo , ROOT.TH3 ) and 3 == len ( vars ) :
+            sc = Ostap.HistoProject.project3 ( frame , histo ,
+                                               vars[2] , vars[1] , vars[0] , cuts )
+        elif isinstance ( histo , ROOT.TH2 ) and 2 == len ( vars ) :
+            sc = Ostap.HistoProject.project2 ( frame , histo ,
+                                               vars[1] , vars[0] , cuts )
+        elif isinstance ( histo , ROOT.TH1 ) and 1 == len ( vars ) and 1 == histo.GetDimension() :
+            sc = Ostap.HistoProject.project  ( frame , histo , vars[0] , cuts )
+        if sc is None or sc.isSuccess () : return sc
+        logger.debug ( 'DataFrame projection failed (%s), fall back to TTree::Project' % sc )
+    except Exception :
+        ## e.g. the expression is rejected by JIT 
+        logger.debug ( 'DataFrame projection failed, fall back to TTree::Project' )
+        
+    return None 
+
 # =============================================================================
 ## Helper project method for RooDataSet
 #
@@ -424,7 +586,12 @@ def ds_project  ( dataset , histo , what , cuts = '' , *args ) :
             store = dataset.store()
             if store :
                 tree = store.tree()
-                if tree : return tree.project ( histo , what , cuts , *args ) 
+                if tree and not args :
+                    sc = _frame_project_ ( tree , histo , what , cuts )
+                    if not sc is None : return sc 
+                if tree :
+                    import ostap.trees.trees ## TTree.project
+                    return tree.project ( histo , what , cuts , *args ) 
             
     if   isinstance ( what , ROOT.RooFormulaVar ) : 
         return ds_project ( dataset , histo , what.GetTitle () , cuts , *args )
@@ -441,7 +608,7 @@ def ds_project  ( dataset , histo , what , cuts = '' , *args ) :
         for w in what :
             if isinstance ( w , str ) : vars.append ( w.strip() )
             else                      : vars.append ( w ) 
-        ##return ds_project ( dataset , histo , vars , cuts , *args ) 
+        what = vars 
 
     if isinstance ( what , ROOT.RooArgList ) :
         vars  = [ w for w in what ]
@@ -454,16 +621,16 @@ def ds_project  ( dataset , histo , what , cuts = '' , *args ) :
     if isinstance ( histo , str ) :
     
         obj = ROOT.gROOT     .FindObject    ( histo )
-        if instance ( obj  , ROOT.TH1 ) :
+        if isinstance ( obj  , ROOT.TH1 ) :
             return ds_project ( dataset , obj , what , cuts , *args )
         obj = ROOT.gROOT     .FindObjectAny ( histo )
-        if instance ( obj  , ROOT.TH1 ) :
+        if isinstance ( obj  , ROOT.TH1 ) :
             return ds_project ( dataset , obj , what , cuts , *args )
         obj = ROOT.gDirectory.FindObject    ( histo )
-        if instance ( obj  , ROOT.TH1 ) :
+        if isinstance ( obj  , ROOT.TH1 ) :
             return ds_project ( dataset , obj , what , cuts , *args )
         obj = ROOT.gDirectory.FindObjectAny ( histo )
-        if instance ( obj  , ROOT.TH1 ) :
+        if isinstance ( obj  , ROOT.TH1 ) :
             return ds_project ( dataset , obj , what , cuts , *args )
 
     if  1 <= len(what) and isinstance ( what[0] , ROOT.RooAbsReal ) and isinstance ( cuts , str ) : 
@@ -554,9 +721,11 @@ def ds_draw ( dataset , what , cuts = '' , opts = '' , *args ) :
 
     if 2 == len ( what )  :
         w1        = what[0] 
-        mn1 , mx1 = ds_var_minmax  ( dataset , w1 , cuts )
         w2        = what[1] 
-        mn2 , mx2 = ds_var_minmax  ( dataset , w2 , cuts )
+        ## get both ranges in a single pass over the dataset 
+        s1 , s2   = dataset.statCov ( w1 , w2 , cuts ) [ : 2 ]
+        mn1 , mx1 = s1.minmax ()
+        mn2 , mx2 = s2.minmax ()
         histo = ROOT.TH2F ( hID() , "%s:%s" % ( w1 , w2 ) ,
                             50 , mn1 , mx1 ,
                             50 , mn2 , mx2 )  ; histo.Sumw2()
@@ -566,15 +735,17 @@ def ds_draw ( dataset , what , cuts = '' , opts = '' , *args ) :
 
     if 3 == len ( what )  :
         w1        = what[0] 
-        mn1 , mx1 = ds_var_minmax ( dataset , w1 , cuts )
         w2        = what[1] 
-        mn2 , mx2 = ds_var_minmax ( dataset , w2 , cuts )
         w3        = what[2] 
+        ## get two ranges in a single pass over the dataset 
+        s1 , s2   = dataset.statCov ( w1 , w2 , cuts ) [ : 2 ]
+        mn1 , mx1 = s1.minmax ()
+        mn2 , mx2 = s2.minmax ()
         mn3 , mx3 = ds_var_minmax ( dataset , w3 , cuts )
         histo = ROOT.TH3F ( hID() , "%s:%s:%s" % ( w1 , w2 , w3 ) ,
                             20 , mn1 , mx1 ,
                             20 , mn2 , mx2 ,
-                            20 , mn2 , mx2 )  ; histo.Sumw2()
+                            20 , mn3 , mx3 )  ; histo.Sumw2()
         ds_project ( dataset , histo , what , cuts , *args  )
         histo.Draw( opts )
         return histo
@@ -590,7 +761,7 @@ def _ds_getattr_ ( dataset , aname ) :
     >>> print dset.pt
     
     """
-    _vars = dataset.get()
+    _vars = _rad_varset_ ( dataset )
     return getattr ( _vars , aname )  
 
 # =============================================================================
@@ -612,10 +783,10 @@ def ds_var_minmax ( dataset , var , cuts = '' , delta = 0.0 )  :
     if cuts : s = dataset.statVar ( var , cuts )
     else    : s = dataset.statVar ( var )
     mn,mx = s.minmax()
-    if mn < mn and 0.0 < delta :
-        dx   = delta * 1.0 * ( mx - mn )  
-        mx  += dx   
+    if 0.0 < delta and mn < mx :
+        dx   = delta * ( mx - mn )  
         mn  -= dx   
+        mx  += dx   
     return mn , mx
 
 
@@ -660,11 +831,10 @@ ROOT.RooDataSet.draw        = ds_draw
 ROOT.RooDataSet.project     = ds_project
 ROOT.RooDataSet.__getattr__ = _ds_getattr_
 
-ROOT.RooDataHist.__len__    = lambda s : s.numEntries() 
-
 _new_methods_ += [
-    ROOT.RooDataSet.draw      ,
-    ROOT.RooDataSet.project   ,
+    ROOT.RooDataSet.draw        ,
+    ROOT.RooDataSet.project     ,
+    ROOT.RooDataSet.__getattr__ ,
     ]
 
 
@@ -685,10 +855,6 @@ def _ds_print_ ( dataset ) :
     if not  valid_pointer ( dataset ) : return 'Invalid dataset'
     return dataset.print_multiline ( verbose = True ) 
 
-ROOT.RooDataSet.draw        = ds_draw
-ROOT.RooDataSet.project     = ds_project
-ROOT.RooDataSet.__getattr__ = _ds_getattr_
-
 for d in ( ROOT.RooAbsData  ,
            ROOT.RooDataSet  ,
            ROOT.RooDataHist ) :
@@ -697,9 +863,6 @@ for d in ( ROOT.RooAbsData  ,
     d.__len__     = lambda s : s.numEntries() 
 
 _new_methods_ += [
-    ROOT.RooDataSet .draw         ,
-    ROOT.RooDataSet .project      ,
-    ROOT.RooDataSet .__getattr__  ,
     ROOT.RooDataHist.__len__      ,
     ]
 
@@ -710,10 +873,9 @@ def _rds_addVar_ ( dataset , vname , formula ) :
 
     >>> dataset.addVar ( 'ratio' , 'pt/pz' )
     """
-    vlst     = ROOT.RooArgList()
-    vset     = dataset.get()
-    for   v     in vset : vlst.add ( v )
+    vlst     = _rad_vlist_ ( dataset )
     #
+    ## the formula is compiled once, the column is filled by the store in C++ loop
     vcol     = ROOT.RooFormulaVar ( vname , formula , formula , vlst )
     dataset.addColumn ( vcol )
     #
@@ -726,6 +888,9 @@ _new_methods_ += [
     ROOT.RooDataSet .addVar       ,
     ]
 
+# =============================================================================
+## operators, that indicate that the weight is an expression, not a variable 
+_formula_ops_ = re.compile ( r'[()*/+\-&|]' )
 # =============================================================================
 ## make weighted data set from unweighted dataset
 #  @code
@@ -747,18 +912,13 @@ def _rds_makeWeighted_ ( dataset , wvarname , varset = None , cuts = '' , vname
         logger.warning ("Dataset '%s/%s' is already weighted!" % ( dataset.GetName  () ,
                                                                    dataset.GetTitle () ) ) 
 
-    ##
-    formula =  0 <= wvarname.find ( '(' ) and wvarname.find( '(' ) < wvarname.find ( ')' )
-    formula = formula or 0 <  wvarname.find ( '*' ) 
-    formula = formula or 0 <  wvarname.find ( '/' )     
-    formula = formula or 0 <= wvarname.find ( '+' ) 
-    formula = formula or 0 <= wvarname.find ( '-' )     
-    formula = formula or 0 <  wvarname.find ( '&' )     
-    formula = formula or 0 <  wvarname.find ( '|' )     
+    ## is it an expression?
+    formula = _formula_ops_.search ( wvarname ) 
 
     if formula :
-        wname    = 'W' or vname 
-        while wname in dataset : wname += 'W'
+        wname    = vname or 'W'
+        names    = set ( v.GetName() for v in _rad_varset_ ( dataset ) )
+        while wname in names : wname += 'W'
         dataset.addVar ( wname , wvarname ) 
         wvarname = wname  
         
@@ -857,34 +1017,53 @@ _new_methods_ += [
     ]
 
 
+# =============================================================================
+## get the variable from the dataset by name (a single lookup)
+#  @code
+#  data = ...
+#  var  = _rad_variable_ ( data , 'mass' ) 
+#  @endcode 
+def _rad_variable_ ( data , name ) :
+    """Get the variable from the dataset by name (a single lookup)
+    >>> data = ...
+    >>> var  = _rad_variable_ ( data , 'mass' ) 
+    """
+    var = data.get().find ( name )
+    assert valid_pointer ( var ) , 'Invalid variable %s' % name 
+    return var
+
 # =============================================================================
 ## get nth moment of the distribution
-def _rad_moment_ ( data , var , order , value = 0 , error = True , *args ) :
+#  - the already known mean value can be specified via <code>mean</code>
+#    keyword argument to avoid its recalculation 
+def _rad_moment_ ( data , var , order , value = 0 , error = True , *args , **kwargs ) :
     """ Get n-th moment of the distribution
     >>> data = ...
     >>> print data.moment ( 'mass' , 3 ) 
+    - the already known mean value can be specified via ``mean'' keyword
+    argument to avoid its recalculation 
     """
     assert isinstance ( order , int ) and 0 <= order, 'Invalid "order"  %s' % order
     
-    if isintance  ( var  , str ) :
-        varset =  data.get()
-        assert  var in varset, 'Invalid variable %s' % var 
-        var = getarrt ( varset , var ) 
-        return _rad_moment_  ( data , var  , order , value , error , *args )
+    if isinstance ( var  , str ) : var = _rad_variable_ ( data , var ) 
 
     m  = data._old_moment_ ( var , order , value , *args )
     if not error : return m
     
-    n     = data.sumEntries( *args ) 
-    sigma = data.sigma ( var , *args )
+    ## the sum of weights and the rms from a single pass over the data 
+    stat  = data.statVar ( var.GetName() , *args )
+    n     = stat.sumw ()
+    sigma = stat.rms  ()
+
+    mean  = kwargs.get ( 'mean' , None ) ## already known mean value?
     
     if  abs  ( value - 0 ) < 0.01 * sigma :
         
-        m2  = data._old_moment ( var , 2 * order , *args )
+        m2  = data._old_moment_ ( var , 2 * order , *args )
         c2  = ( m2  - m * m )
         c2 /= n
         
-    elif  abs  ( value - data._old_moment_ ( var  , 1 , 0  , *args  ) ) < 0.01 * sigma :
+    elif  abs  ( value - ( data._old_moment_ ( var , 1 , 0 , *args ) if mean is None else mean ) ) < 0.01 * sigma :
 
         m2  = data._old_moment_ ( var , 2             , value , *args )
         m2o = data._old_moment_ ( var , 2 * order     , value , *args )
@@ -915,24 +1094,20 @@ def _rad_central_moment_ ( data , var  , order , error = True , *args  ) :
     >>> print data.central_moment ( 'mass' , 3 ) 
     """
     ##  get the men-value:
-    mu = _rad_moment_  ( data , var  , 1 , error = False , *args )
-    ##  calcualte moments  
-    return _rad_moment_ ( data , var , order , mu  , error , *args )
+    mu = _rad_moment_  ( data , var  , 1 , 0 , False , *args )
+    ##  calcualte moments (reuse the mean value)
+    return _rad_moment_ ( data , var , order , mu  , error , *args , mean = mu )
 
 
 # =============================================================================
 def _rad_skewness_ ( data , var , error = True , *args ) :
     
-    if isintance  ( var  , str ) :
-        varset =  data.get()
-        assert var in varset, 'Invalid variable %s' % var  
-        var = getarrt ( varset , var ) 
-        return _rad_skewness_  ( data , var , error , *args )
+    if isinstance ( var  , str ) : var = _rad_variable_ ( data , var ) 
     
     s  = data._old_skewness_ ( var , *args )
     if not error : return s
     
-    n = dat.sumEntries( *args ) 
+    n = data.sumEntries( *args ) 
 
     if 2 > n : return VE ( s , 0 )
 
@@ -945,16 +1120,12 @@ def _rad_skewness_ ( data , var , error = True , *args ) :
 # =============================================================================
 def _rad_kurtosis_ ( data , var , error = True , *args ) :
     
-    if isintance  ( var  , str ) :
-        varset =  data.get()
-        assert var in varset, 'Invalid variable %s' % var 
-        var = getarrt ( varset , var ) 
-        return _rad_kurtisis_  ( data , var , error , *args )
+    if isinstance ( var  , str ) : var = _rad_variable_ ( data , var ) 
 
     k  = data._old_kurtosis_ ( var , *args )
     if not error : return k
     
-    n = dat.sumEntries( *args ) 
+    n = data.sumEntries( *args ) 
     
     if 3 > n : return VE ( k , 0 )
 
@@ -968,18 +1139,18 @@ def _rad_kurtosis_ ( data , var , error = True , *args ) :
 
 RAD  = ROOT.RooAbsData
 if  not hasattr ( RAD , '_new_moment_' ) :
-    RAD.__old_moment_   = RAD.moment
-    RAD.__new_moment_   = _rad_moment_
+    RAD._old_moment_    = RAD.moment
+    RAD._new_moment_    = _rad_moment_
     RAD.moment          = _rad_moment_
     
 if  not hasattr ( RAD , '_new_skewness_' ) :
-    RAD.__old_skewness_ = RAD.skewness
-    RAD.__new_skewness_ = _rad_skewness_
+    RAD._old_skewness_  = RAD.skewness
+    RAD._new_skewness_  = _rad_skewness_
     RAD.skewness        = _rad_skewness_
 
 if  not hasattr ( RAD , '_new_kurtosis_' ) :
-    RAD.__old_kurtosis_ = RAD.kurtosis
-    RAD.__new_kurtosis_ = _rad_kurtosis_
+    RAD._old_kurtosis_  = RAD.kurtosis
+    RAD._new_kurtosis_  = _rad_kurtosis_
     RAD.kurtosis        = _rad_kurtosis_
 
 RAD.central_moment = _rad_central_moment_
@@ -1014,19 +1185,16 @@ def _rad_branches_ (  self , pattern = '' , *args ) :
     vlst = self.varset()
     if not vlst : return tuple()
 
+    names = [ v.GetName() for v in vlst ]
+    
     if pattern :        
         try : 
-            import re
-            c  =  re.compile ( pattern , *args )
-            lst  = [ v.GetName() for v in vlst if c.match ( v.GetName () ) ]
-            lst.sort()
-            return tuple ( lst ) 
+            c    = re.compile ( pattern , *args )
+            return tuple ( sorted ( n for n in names if c.match ( n ) ) )
         except :
             logger.error ('branches: exception is caught, skip it' , exc_info = True ) 
             
-    lst  = [ v.GetName() for v in vlst  ]
-    lst.sort()
-    return tuple ( lst ) 
+    return tuple ( sorted ( names ) ) 
 
 
 RAD.branches = _rad_branches_
@@ -1047,6 +1215,12 @@ def _ds_table_0_ ( dataset , variables = [] , cuts = '' , first = 0 , last = 2**
         logger.error('Invalid dataset')
         return ''
 
+    ## the names and titles of all variables (collected once)
+    vinfo        = [ ( i.GetName() , i.GetTitle() ) for i in varset ]
+    varnames     = [ n for n , t in vinfo ]
+    varset_names = frozenset ( varnames )
+    titles       = dict ( vinfo ) 
+    
     if isinstance ( variables ,  str ) :
         variables = variables.strip ()
         variables = variables.replace ( ',' , ' ' ) 
@@ -1057,24 +1231,33 @@ def _ds_table_0_ ( dataset , variables = [] , cuts = '' , first = 0 , last = 2**
 
     if isinstance ( variables ,  str ) :
         
-        if variables in varset :
+        if variables in varset_names :
             vars = [ variables ]
         else :
             vars = list ( dataset.branches ( variables ) ) 
             
-    elif variables : vars = [ i.GetName() for i in varset if i in variables ]        
-    else           : vars = [ i.GetName() for i in varset                   ]
+    elif variables :
+        selected = set ( [ v if isinstance ( v , str ) else v.GetName() for v in variables ] )
+        vars     = [ n for n in varnames if n in selected ]        
+    else           : vars = list ( varnames )
         
     #
+    ## get the statistics for all variables in a single loop over the dataset 
+    stats = []
+    if vars : 
+        from ostap.core.core import std, strings, WSE 
+        vct   = strings ( *vars )
+        res   = std.vector ( WSE ) ()
+        Ostap.StatVar.statVars ( dataset , res , vct , cuts , first , last )
+        stats = [ WSE ( res [ i ] ) for i in range ( res.size() ) ]
+        
     _vars = []
-    for v in vars :
-        vv   = getattr ( varset , v ) 
-        s    = dataset.statVar( v , cuts , first , last )  
+    for v , s in zip ( vars , stats ) :
         mnmx = s.minmax ()
         mean = s.mean   ()
         rms  = s.rms    ()
-        r    = ( vv.GetName  () ,                      ## 0 
-                 vv.GetTitle () ,                      ## 1 
+        r    = ( v                ,                    ## 0 
+                 titles [ v ]     ,                    ## 1 
                  ('%+.5g' % mean.value() ).strip() ,   ## 2
                  ('%.5g'  % rms          ).strip() ,   ## 3 
                  ('%+.5g' % mnmx[0]      ).strip() ,   ## 4
@@ -1082,7 +1265,7 @@ def _ds_table_0_ ( dataset , variables = [] , cuts = '' , first = 0 , last = 2**
             
         _vars.append ( r )
         
-    _vars.sort()
+    _vars.sort ( key = operator.itemgetter ( 0 ) )
 
     report  = '# %s("%s","%s"):' % ( dataset.__class__.__name__ ,
                                      dataset.GetName  () ,
@@ -1119,10 +1302,9 @@ def _ds_table_0_ ( dataset , variables = [] , cuts = '' , first = 0 , last = 2**
 
         if store and hasattr ( store , 'tree' ) and valid_pointer ( store.tree() ) :
 
+            import ostap.trees.trees ## TTree.branches/statVar
             tree = store.tree() 
-            branches = set ( tree.branches() )
-            vvars    = set ( [ i.GetName() for i in  varset ] )
-            wvars    = branches - vvars
+            wvars    = set ( tree.branches() ) - varset_names 
             
             if 1 == len ( wvars ):
                 wvar = wvars.pop()
@@ -1216,26 +1398,20 @@ def _ds_table_0_ ( dataset , variables = [] , cuts = '' , first = 0 , last = 2**
                       'min'         ,
                       'max'         )
     
-    report += '\n' + sep
-    report += '\n' + header
-    report += '\n' + sep
-
     vlst   = _vars
     
     if weight : vlst = _vars[:-1]
-    
-    for v in vlst :
-        line    =  fmt % ( v[0] , v[1] , v[2] , v[3] , v[4] , v[5]  )
-        report += '\n' + line  
-    report += '\n' + sep
+
+    parts  = [ report , sep , header , sep ]
+    parts.extend ( fmt % v for v in vlst )
+    parts.append ( sep )
     
     if weight :
-        v = _vars[-1]
-        line    =  fmt % ( v[0] , v[1] , v[2] , v[3] , v[4] , v[5]  )
-        report += '\n' + line.replace ( weight , attention ( weight ) ) 
-        report += '\n' + sep
+        line    =  fmt % _vars[-1]
+        parts.append ( line.replace ( weight , attention ( weight ) ) ) 
+        parts.append ( sep )
         
-    return report , len ( sep ) 
+    return '\n'.join ( parts ) , len ( sep ) 
 
 
 # ==============================================================================
@@ -1251,6 +1427,18 @@ def _ds_table_ (  dataset ,  variables = [] ) :
     """
     return _ds_table_0_ ( dataset ,  variables )[0]
 
+# =============================================================================
+## cached result of <code>isatty()</code> for printout of datasets
+_ds_tty_ = [] 
+# =============================================================================
+## invalidate the cached result of <code>isatty()</code>
+#  (e.g. when <code>sys.stdout</code> is redirected)
+def invalidate_tty_cache () :
+    """Invalidate the cached result of isatty() used for printout of datasets
+    (e.g. when sys.stdout is redirected)
+    """
+    del _ds_tty_ [ : ]
+    
 # =============================================================================
 ##  print DataSet
 def _ds_print2_ ( dataset ) :
@@ -1259,8 +1447,8 @@ def _ds_print2_ ( dataset ) :
         store = dataset.store()
         if valid_pointer ( store ) and isinstance ( store , ROOT.RooTreeDataStore ) : pass
         else : return _ds_print_ ( dataset )        
-    from ostap.utils.basic import terminal_size, isatty 
-    if not isatty() : return _ds_table_ ( dataset )
+    if not _ds_tty_ : _ds_tty_.append ( isatty () ) 
+    if not _ds_tty_ [ 0 ] : return _ds_table_ ( dataset )
     th  , tw  = terminal_size()
     rep , wid = _ds_table_0_ ( dataset ) 
     if wid < tw     : return rep
@@ -1281,6 +1469,65 @@ _new_methods_ += [
     ROOT.RooDataSet.__str__  ,
     ]
 
+# =============================================================================
+## get the columns of the dataset as flat (N,k) block of doubles
+#  - for TTree-based storage the columns are read in bulk via
+#    <code>TTree::Draw</code> (up to 4 columns per pass)
+#  - otherwise the dataset is iterated entry by entry
+#  @code
+#  ds    = ...
+#  block = _ds_columns_ ( ds , [ 'x' , 'y' ] )
+#  x5 , y5 = block [ 5 * 2 ] , block [ 5 * 2 + 1 ] 
+#  @endcode 
+def _ds_columns_ ( ds , names ) :
+    """Get the columns of the dataset as flat (N,k) block of doubles
+    - for TTree-based storage the columns are read in bulk via TTree::Draw
+    - otherwise the dataset is iterated entry by entry 
+    >>> ds    = ...
+    >>> block = _ds_columns_ ( ds , [ 'x' , 'y' ] )
+    >>> x5 , y5 = block [ 5 * 2 ] , block [ 5 * 2 + 1 ] 
+    """
+    N     = len ( ds    )
+    k     = len ( names )
+    block = array.array ( 'd' , [ 0.0 ] ) * ( N * k )
+    if not N or not k : return block
+
+    ## 1) bulk read from TTree 
+    store = ds.store ()
+    tree  = None 
+    if valid_pointer ( store ) and isinstance ( store , ROOT.RooTreeDataStore ) :
+        tree = store.tree ()
+        
+    if tree and valid_pointer ( tree ) and N == tree.GetEntries () :
+        
+        estimate = tree.GetEstimate ()
+        tree.SetEstimate ( N + 1 )
+        try : 
+            for j0 in range ( 0 , k , 4 ) :
+                group = names [ j0 : j0 + 4 ]
+                ## TTree::Draw returns -1 for invalid expressions 
+                if N != tree.Draw ( ':'.join ( group ) , '' , 'goff' ) : break 
+                for j , n in enumerate ( group ) :
+                    buf = tree.GetVal ( j )
+                    buf.SetSize ( N ) 
+                    block [ j0 + j : : k ] = array.array ( 'd' , buf )
+            else :
+                return block                                     ## RETURN
+        except ( AttributeError , TypeError , ValueError ) :
+            ## e.g. the buffer can't be sized: use the generic case 
+            logger.debug ( 'columns: bulk read is not possible, iterate entry by entry' )
+        finally :
+            tree.SetEstimate ( estimate )
+            
+    ## 2) generic case: (RooAbsData::get(i) reloads the values into the same variables)
+    dvars  = ds.get ()
+    source = [ dvars.find ( n ) for n in names ]
+    for i in range ( N ) :
+        ds.get ( i ) 
+        block [ i * k : ( i + 1 ) * k ] = array.array ( 'd' , [ v.getVal () for v in source ] )
+        
+    return block
+
 # =============================================================================
 ## make symmetrization/randomization of the dataset
 #  @code
@@ -1316,18 +1563,36 @@ def _ds_symmetrize_ ( ds , var1 , var2 , *vars ) :
             if hasattr ( v ,  'setMin' ) : v.setMin ( mnv )
             if hasattr ( v ,  'setMax' ) : v.setMax ( mxv )        
     
-    ## loop over the data set 
-    for entry in ds :
-
-        values = [ v.getVal() for v in entry if v in varset ]
-        random.shuffle ( values )
-
-        for v in nvarset :
-            n = v.name 
-            if not n in names : v.setVal ( entry[n].value )                
-            else              : v.setVal ( values.pop()   )
-
-        nds.add ( nvarset )
+    N = len ( ds     )
+    k = len ( names  )
+    
+    ## (1) extract the symmetrized columns as (N,k) block and
+    #      permute each row in place (Fisher-Yates) 
+    block  = _ds_columns_ ( ds , names )
+    rnd    = random.random 
+    for i in range ( N ) :
+        base = i * k 
+        for j in range ( k - 1 , 0 , -1 ) :
+            r  = base + int ( rnd () * ( j + 1 ) )
+            block [ base + j ] , block [ r ] = block [ r ] , block [ base + j ]
+        
+    ## (2) write back: copy the entry and replace the symmetrized values
+    if _fill_ :
+        targets = ROOT.RooArgList () 
+        for n in names : targets.add ( nvarset.find ( n ) )
+        _fill_ ( ds , nds , targets , block , N ) 
+        return nds
+    
+    ## (the bound methods are resolved once, outside of the loop)
+    setters = [ nvarset.find ( n ).setVal for n in names ]
+    get     = ds.get
+    add     = nds.add
+    assign  = nvarset.assignValueOnly 
+    for i in range ( N ) :
+        assign ( get ( i ) )
+        base = i * k 
+        for j , setv in enumerate ( setters ) : setv ( block [ base + j ] )
+        add ( nvarset , ds.weight () )
         
     return nds
 
@@ -22,7 +22,7 @@ __all__     = (
     'KeepArgs'  , ## context manager to preserve the content of the list
     ) 
 # =============================================================================
-import ROOT, random
+import ROOT, random, array
 from   ostap.core.core         import Ostap
 import ostap.fitting.variables
 # =============================================================================
@@ -379,6 +379,38 @@ _new_methods_ += [
     ##
     ]
 
+# =============================================================================
+## get the values and errors of all elements of the collection 
+#  as two arrays of doubles (filled in a single C++ loop)
+#  - for non-real elements the value is NaN
+#  - the error is zero for elements other than RooRealVar 
+#  @code
+#  params = ...
+#  values , errors = params.values_errors () 
+#  @endcode
+#  @see Ostap::Utils::valuesErrors
+def _rac_values_errors_ ( self ) :
+    """Get the values and errors of all elements of the collection
+    as two arrays of doubles (filled in a single C++ loop)
+    - for non-real elements the value is NaN
+    - the error is zero for elements other than RooRealVar 
+    >>> params = ...
+    >>> values , errors = params.values_errors () 
+    """
+    n      = len ( self )
+    values = array.array ( 'd' , [ 0.0 ] ) * n 
+    errors = array.array ( 'd' , [ 0.0 ] ) * n
+    if n : Ostap.Utils.valuesErrors ( self , values , errors , n )
+    return values , errors
+
+ROOT.RooArgSet  . values_errors = _rac_values_errors_
+ROOT.RooArgList . values_errors = _rac_values_errors_
+
+_new_methods_ += [
+    ROOT.RooArgSet     . values_errors ,
+    ROOT.RooArgList    . values_errors ,
+    ]
+
 # =============================================================================
 ## @class KeepArg
 #  Simple contect manager for temporary redefitnnnonn of some mutable collection
@@ -208,14 +208,28 @@ def _rfr_getattr_ ( self , att ) :
 #  >>> r = ...
 #  >>> print r.sum( 'S' , 'B' )  ## S+B
 #  @endcode
-def _rfr_sum_ ( self , var1 , var2 , *vars ) :
+#  The variables can also be specified as a single RooFit collection
+#  (the only case when one argument is allowed):
+#  @code
+#  >>> r = ...
+#  >>> print r.sum( pdf.alist2 )  ## sum of all yields 
+#  @endcode
+def _rfr_sum_ ( self , var1 , *vars ) :
     """Get correct estimate of sum of two or more variables,
     taking into account correlations
     >>> r = ...
     >>> print r.sum( 'S' , 'B' ) ## S+B
+    The variables can also be specified as a single RooFit collection
+    (the only case when one argument is allowed):
+    >>> print r.sum( pdf.alist2 ) ## sum of all yields 
     """
-    allvars = ( var1 , var2 ) + vars 
+    if vars : allvars = ( var1 , ) + vars
+    elif isinstance ( var1 , ROOT.RooAbsCollection ) :
+        allvars = tuple ( var1 ) 
+    else :
+        raise TypeError ( "RooFitResult.sum: two or more variables or a RooFit collection are required" )
     n       = len ( allvars ) 
+    const   = self.constPars()
     s  = 0
     c2 = 0
     for i in range ( n ) :
@@ -225,12 +239,12 @@ def _rfr_sum_ ( self , var1 , var2 , *vars ) :
         v   = VE ( v ) 
         s  += v . value ()
         vc  = v.cov2() 
-        if 0 >= vc or vi in self.constPars() : continue        
+        if 0 >= vc or vi in const : continue        
         c2 += vc 
         for j in range ( i + 1 , n ) :
             vj  = allvars [ j ]
             if isinstance ( vj , str ) : vj = self.param ( vj ) [1]
-            if vj in self.constPars()  : continue        
+            if vj in const             : continue        
             c2 += 2 * self.correlation ( vi , vj ) 
             
     return VE ( s , c2 ) 
@@ -160,8 +160,9 @@ class MakeVar ( object ) :
     ## @attention ensure that important attributes are available even before __init__
     def __new__( cls, *args, **kwargs):
         obj = super(MakeVar, cls).__new__( cls , *args , **kwargs )
-        obj.__aux_keep = []                      ## ATTENTION!        
-        obj.__name     = None                    ## ATTENTION!
+        obj.__aux_keep    = []                   ## ATTENTION!        
+        obj.__name        = None                 ## ATTENTION!
+        obj.__constraints = {}                   ## ATTENTION!
         return obj
     
     ##  produce ERROR    message using the local logger 
@@ -503,12 +504,12 @@ class MakeVar ( object ) :
 
         assert 0 < value.cov2() , 'Invalid error for %s' % value
         
-        name  = name  if name  else 'Gauss_%s_%s'                       % ( var.GetName() , self.name ) 
-        title = title if title else 'Gauissian Constraint(%s,%s) at %s' % ( var.GetName() , self.name , value )
+        name  = name  if name  else 'Gauss_%s_%s'  % ( var.GetName() , self.name ) 
+        title = title if title else self.__constraint_title ( var , value ) 
         
-        # value & error as RooFit objects: 
-        val = ROOT.RooFit.RooConst ( value.value () )
-        err = ROOT.RooFit.RooConst ( value.error () )
+        # value & error as (constant) RooFit objects: 
+        val = ROOT.RooRealVar ( name + '_value' , 'value(%s)' % title , value.value () )
+        err = ROOT.RooRealVar ( name + '_error' , 'error(%s)' % title , value.error () )
         
         # Gaussian constrains 
         gauss = ROOT.RooGaussian ( name , title , var , val , err )
@@ -521,6 +522,12 @@ class MakeVar ( object ) :
         self.info ('Constraint is created %s=%s' % ( var.name , value ) )
         return  gauss 
 
+    # =========================================================================
+    ## the default title for the soft Gaussian constraint 
+    def __constraint_title ( self , var , value ) :
+        """The default title for the soft Gaussian constraint"""
+        return 'Gauissian Constraint(%s,%s) at %s' % ( var.GetName() , self.name , value )
+
     # ==========================================================================
     ## Helper function to  create soft Gaussian constraint
     #  to the ratio of <code>a</code> and <code>b</code>
@@ -682,14 +689,40 @@ class MakeVar ( object ) :
     #  sigma      = ...
     #  constraint = pdf.make_constraint( sigma , VE ( 0.15 , 0.01**2 ) )
     #  pdf.fitTo ( ... ,  constraints =  constraint ) 
-    #  @endcode 
+    #  @endcode
+    #  @attention the constraint with the same name is reused:
+    #  its value, error and title are updated, no new objects are created
+    #  (e.g. for the scans over the constraint value).
+    #  Therefore all <code>ExternalConstraints</code> objects returned earlier
+    #  for this name are aliases: they refer to the updated value too.
     def make_constraint ( self , var , value , name = '' ,  title = '' ) :
         """Create ready-to-use ``soft'' gaussian constraint for the variable
         
         >>> var     = ...                            ## the variable 
         >>> extcntr = var.constaint( VE(1,0.1**2 ) ) ## create constrains 
         >>> model.fitTo ( ... , extcntr )            ## use it in the fit 
+        - attention: the constraint with the same name is reused:
+        its value, error and title are updated, no new objects are created,
+        therefore all objects returned earlier for this name refer to the updated value too
         """
+
+        key    = name if name else 'Gauss_%s_%s' % ( var.GetName() , self.name )
+        cached = self.__constraints.get ( key , None )
+        if cached and cached [ 0 ] is var :
+            
+            assert isinstance ( value , VE ) and 0 < value.cov2() ,\
+                   "Invalid ``value'': %s/%s"  % ( value , type ( value ) )
+            
+            v , gauss , val , err , result = cached
+            val.setVal ( value.value () )
+            err.setVal ( value.error () )
+            ## keep the title in sync with the value 
+            title = title if title else self.__constraint_title ( var , value )
+            gauss.SetTitle ( title )
+            val  .SetTitle ( 'value(%s)' % title )
+            err  .SetTitle ( 'error(%s)' % title )
+            self.info ('Constraint is updated %s=%s' % ( var.name , value ) )
+            return result
         
         ## create the gaussian constraint
         gauss  = self.soft_constraint ( var , value , name ,  title ) 
@@ -699,6 +732,11 @@ class MakeVar ( object ) :
         result = ROOT.RooFit.ExternalConstraints ( cnts )
         
         self.aux_keep.append ( cnts   )
+
+        ## keep value and error of the constraint for the later updates 
+        val = gauss.findServer ( key + '_value' )
+        err = gauss.findServer ( key + '_error' )
+        self.__constraints [ key ] = var , gauss , val , err , result 
         
         return result 
 
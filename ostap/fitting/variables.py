@@ -31,8 +31,8 @@ __all__     = (
     'two_yields'      , ## ``converter'': T,F ->  (A,B) == ( R*F , T*(1-F) )
     ) 
 # =============================================================================
-import ROOT, random
-from   ostap.core.core  import VE
+import ROOT, random, operator, types
+from   ostap.core.core  import VE, hID, Ostap
 from   ostap.core.types import num_types 
 # =============================================================================
 # logging 
@@ -82,6 +82,10 @@ def _rel_par_ ( var )  :
     #
     return var.ve()
 
+# ==============================================================================
+## C++ helper to get value with error for RooRealVar in a single call 
+#  @see Ostap::Utils::valueWithError
+_value_with_error_ = getattr ( Ostap.Utils , 'valueWithError' , None ) 
 # ==============================================================================
 ## Convert RooRealVar into ValueWithError 
 #  @author Vanya BELYAEV Ivan.Belyaev@itep.ru
@@ -92,6 +96,8 @@ def _rrv_ve_ ( var ) :
     >>> par = ...
     >>> ve  = par.ve()    
     """
+    if _value_with_error_ : return _value_with_error_ ( var ) ## single C++ call 
+    #
     v  =      var.getVal()
     e2 = 0 if var.isConstant() else var.getError()**2
     #
@@ -122,7 +128,7 @@ ROOT.RooRealVar     . Fix             = _fix_par_
 ROOT.RooRealVar     . release         = _rel_par_
 ROOT.RooRealVar     . Release         = _rel_par_
 ## convert to float 
-ROOT.RooRealVar     . __float__       = lambda s : s.getVal()
+ROOT.RooRealVar     . __float__       = ROOT.RooRealVar.getVal ## direct C++ call, no lambda 
 ## print it in more suitable form 
 ROOT.RooRealVar     . __repr__        = lambda s : "'%s' : %s " % ( s.GetName() , s.ve() )
 ROOT.RooRealVar     . __str__         = lambda s : "'%s' : %s " % ( s.GetName() , s.ve() )
@@ -204,172 +210,75 @@ _new_methods_ += [
 # =============================================================================
 
 # ============================================================================
-## Addition of RooRealVar and ``number''
-def _rrv_add_ ( s , o ) :
-    """Addition of RooRealVar and ``number''
-
-    >>> var = ...
-    >>> num = ...
-    >>> res = var + num
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return v + o
-
-# ============================================================================
-## Subtraction  of RooRealVar and ``number''
-def _rrv_sub_ ( s , o ) :
-    """Subtraction of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = var - num
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return v - o
-
-# ============================================================================
-## Multiplication of RooRealVar and ``number''
-def _rrv_mul_ ( s , o ) :
-    """Multiplication  of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = var * num
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return v * o
-
-# ============================================================================
-## Division of RooRealVar and ``number''
-def _rrv_div_ ( s , o ) :
-    """Division of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = var / num
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return v / o
-
-# ============================================================================
-## (right) Addition of RooRealVar and ``number''
-def _rrv_radd_ ( s , o ) :
-    """(right) Addition of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = num + var 
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return o + v 
-
-# ============================================================================
-## (right) subtraction  of RooRealVar and ``number''
-def _rrv_rsub_ ( s , o ) :
-    """(right) subtraction of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = num - var 
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return o - v 
-
+## convert non-constant RooRealVar operand into VE, constant one into float 
+def _rrv_operand_rrv_ ( o ) :
+    """Convert non-constant RooRealVar operand into VE, constant one into float"""
+    return o.getVal() if o.isConstant() else _rrv_ve_ ( o ) 
 # ============================================================================
-## (right) multiplication of RooRealVar and ``number''
-def _rrv_rmul_ ( s , o ) :
-    """(right) Multiplication  of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = num * var     
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return o * v 
-
+## convert RooFit operand into float
+def _rrv_operand_val_ ( o ) :
+    """Convert RooFit operand into float"""
+    return o.getVal()
 # ============================================================================
-## (right) Division of RooRealVar and ``number''
-def _rrv_rdiv_ ( s , o ) :
-    """(right) Division of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = num / var     
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return o / v 
-
+## the operand converters, dispatched by the type of operand
+#  (<code>None</code> : the operand is used as it is) 
+_rrv_operands_ = dict ( ( t , None ) for t in num_types ) 
+## instances of all old-style classes share the same type: they are not cached 
+_instance_type_ = getattr ( types , 'InstanceType' , None ) 
 # ============================================================================
-## pow of RooRealVar and ``number''
-def _rrv_pow_ ( s , o ) :
-    """pow of RooRealVar and ``number''
-    
-    >>> var = ...
-    >>> num = ...
-    >>> res = var ** num     
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return v**o  
+## get the converter for the operand (and cache it for the type of operand) 
+def _rrv_operand_converter_ ( o ) :
+    """Get the converter for the operand (and cache it for the type of operand)"""
+    if   isinstance ( o , num_types ) : conv = None 
+    elif isinstance ( o , _RRV_     ) : conv = _rrv_operand_rrv_
+    elif hasattr    ( o , 'getVal'  ) : conv = _rrv_operand_val_
+    else                              : conv = None
+    t = type ( o )
+    if not t is _instance_type_ : _rrv_operands_ [ t ] = conv
+    return conv
 
 # ============================================================================
-## (right) pow of RooRealVar and ``number''
-def _rrv_rpow_ ( s , o ) :
-    """pow of RooRealVar and ``number''
+## create the binary operator for RooRealVar and ``number''
+#  - non-constant RooRealVar operands are used as VE  (value+error)  
+#  - other RooFit objects are used via <code>getVal</code>
+#  @code
+#  _rrv_add_ = _rrv_operator_ ( operator.add , '_rrv_add_' , 'Addition' , 'var + num' )
+#  @endcode 
+def _rrv_operator_ ( op , name , what , example ) :
+    """Create the binary operator for RooRealVar and ``number''
+    - non-constant RooRealVar operands are used as VE (value+error)
+    - other RooFit objects are used via getVal
+    """
+    def _operator_ ( s , o ) :
+        #
+        t = type ( o ) 
+        conv = _rrv_operands_ [ t ] if t in _rrv_operands_ else _rrv_operand_converter_ ( o ) 
+        if conv : o = conv ( o )
+        #
+        v = s.getVal() if s.isConstant() else _rrv_ve_ ( s ) 
+        #
+        return op ( v , o )
+    
+    _operator_.__name__ = name
+    _operator_.__doc__  = """%s of RooRealVar and ``number''
     
     >>> var = ...
     >>> num = ...
-    >>> res = num ** var 
-    
-    """
-    if   isinstance ( o , _RRV_    ) and not o.isConstant() : o = o.ve     () 
-    elif hasattr    ( o , 'getVal' )                        : o = o.getVal ()
-    #
-    v = s.getVal() if s.isConstant() else s.ve()
-    #
-    return o**v   
-
+    >>> res = %s
+    """ % ( what , example )
+    
+    return _operator_
+
+_rrv_add_  = _rrv_operator_ ( operator.add               , '_rrv_add_'  , 'Addition'               , 'var + num'  )  
+_rrv_sub_  = _rrv_operator_ ( operator.sub               , '_rrv_sub_'  , 'Subtraction'            , 'var - num'  )  
+_rrv_mul_  = _rrv_operator_ ( operator.mul               , '_rrv_mul_'  , 'Multiplication'         , 'var * num'  )  
+_rrv_div_  = _rrv_operator_ ( lambda v , o : v / o       , '_rrv_div_'  , 'Division'               , 'var / num'  )  
+_rrv_pow_  = _rrv_operator_ ( operator.pow               , '_rrv_pow_'  , 'pow'                    , 'var ** num' )  
+_rrv_radd_ = _rrv_operator_ ( lambda v , o : o + v       , '_rrv_radd_' , '(right) Addition'       , 'num + var'  )  
+_rrv_rsub_ = _rrv_operator_ ( lambda v , o : o - v       , '_rrv_rsub_' , '(right) Subtraction'    , 'num - var'  )  
+_rrv_rmul_ = _rrv_operator_ ( lambda v , o : o * v       , '_rrv_rmul_' , '(right) Multiplication' , 'num * var'  )  
+_rrv_rdiv_ = _rrv_operator_ ( lambda v , o : o / v       , '_rrv_rdiv_' , '(right) Division'       , 'num / var'  )  
+_rrv_rpow_ = _rrv_operator_ ( lambda v , o : o ** v      , '_rrv_rpow_' , '(right) pow'            , 'num ** var' )  
 
 # ============================================================================
 ROOT.RooRealVar . __add__   = _rrv_add_
@@ -490,14 +399,45 @@ def _rav_getval_  ( self ) :
     """
     return self.getVal()
 
+# =============================================================================
+## C++ helper to get the value and the error in a single call 
+#  @see Ostap::Utils::valueAndError
+_value_and_error_ = getattr ( Ostap.Utils , 'valueAndError' , None ) 
+# =============================================================================
+## get the value and the error as a plain tuple (no VE is created)
+#  - the error is zero for non-RooRealVar objects 
+#  @code
+#  var   = ...
+#  v , e = var.val_err()
+#  @endcode 
+def _rav_val_err_ ( self ) :
+    """Get the value and the error as a plain tuple (no VE is created)
+    - the error is zero for non-RooRealVar objects 
+    >>> var   = ...
+    >>> v , e = var.val_err()
+    """
+    if _value_and_error_ :
+        r = _value_and_error_ ( self )       ## single C++ call 
+        return r.first , r.second
+    #
+    e = self.getError() if isinstance ( self , ROOT.RooRealVar ) else 0.0
+    return self.getVal() , e
+
+ROOT.RooAbsReal.val     = ROOT.RooAbsReal.getVal  ## direct C++ call, no property
+ROOT.RooAbsReal.val_err = _rav_val_err_
+
+_new_methods_ += [
+    ROOT.RooAbsReal.val     ,
+    ROOT.RooAbsReal.val_err ,
+    ]
+
 # =============================================================================
 def _rav_getvale_ ( self ) :
     """Get the value(and the error), associated with the variable
     >>> var = ...
     >>> print  var.value 
     """
-    v = self.getVal()
-    e = self.getError() 
+    v , e = _rav_val_err_ ( self ) 
     return VE ( v , e*e ) if e>0 else v
 
 # =============================================================================
@@ -506,9 +446,8 @@ def _rav_setval_  ( self , value ) :
     >>> var = ...
     >>> var.value = 10 
     """
-    value = float ( value )
+    if type ( value ) is not float : value = float ( value )
     self.setVal ( value ) 
-    return self.getVal()
 
 # =============================================================================
 def _rav_setvalc_  ( self , value ) :
@@ -516,12 +455,11 @@ def _rav_setvalc_  ( self , value ) :
     >>> var = ...
     >>> var.value = 10 
     """
-    value = float ( value )
+    if type ( value ) is not float : value = float ( value )
     mn,mx  = self.getMin(), self.getMax() 
     if not mn <= value <= mx :
         logger.warning('Value %s is out the range [%s,%s]' %  ( value  , mn , mx ) ) 
     self.setVal ( value ) 
-    return self.getVal()
 
 # =============================================================================
 def _rav_geterr_  ( self ) :
@@ -537,11 +475,21 @@ def _rav_seterr_  ( self , value ) :
     >>> var = ...
     >>> var.error = 10 
     """
-    value = float ( value )
+    if type ( value ) is not float : value = float ( value )
     if not 0<= value :
         logger.warning('Error %s is not non-negative' % value  ) 
     self.setError ( value )
-    return self.getError()
+
+# =============================================================================
+## the accessors for the decorated classes:
+#  ( value getter , value setter , error getter , error setter )
+#  - written explicitly: the classes are known, no need to probe them at import 
+_rav_properties_ = {
+    ROOT.RooAbsReal       : ( _rav_getval_  , None          , None         , None         ) ,
+    ROOT.RooAbsLValue     : ( None          , None          , None         , None         ) ,
+    ROOT.RooAbsRealLValue : ( _rav_getval_  , _rav_setvalc_ , None         , None         ) ,
+    ROOT.RooRealVar       : ( _rav_getvale_ , _rav_setvalc_ , _rav_geterr_ , _rav_seterr_ ) ,
+    }
 
 # =============================================================================
 ## decorate classes 
@@ -550,18 +498,7 @@ for t in ( ROOT.RooAbsReal       ,
            ROOT.RooAbsRealLValue , 
            ROOT.RooRealVar       ) :
 
-    _getter_ = None
-    _setter_ = None
-
-    if hasattr  ( t , 'getVal' ) and hasattr ( t , 'getError' ) :
-        _getter_ = _rav_getvale_
-    elif hasattr  ( t , 'getVal' ) :
-        _getter_ = _rav_getval_
-
-    if hasattr  ( t , 'setVal' ) and hasattr ( t , 'getMin' ) and hasattr ( t , 'getMax' ) :
-        _setter_ = _rav_setvalc_
-    elif hasattr  ( t , 'setVal' ) :
-        _setter_ = _rav_setval_
+    _getter_ , _setter_ , _gettere_ , _settere_ = _rav_properties_ [ t ]
 
     doc1 = """The current value, associated with the variable,
     
@@ -617,21 +554,12 @@ for t in ( ROOT.RooAbsReal       ,
     >>> var.error = 15 
     
     """
-    
-    _gettere_ = None
-    _settere_ = None
-
-    if hasattr  ( t , 'getError' ) and hasattr ( t , 'setError' ) :
-        _gettere_ = _rav_geterr_
-        _settere_ = _rav_seterr_
-    elif hasattr  ( t , 'getError' ) :
-        _gettere_ = _rav_geterr_
 
     if   _settere_  : t.error = property ( _gettere_ , _settere_ , None  , doce2 )
     elif _gettere_  : t.error = property ( _gettere_ , _settere_ , None  , doce1 )
 
-    if hasattr ( t , 'getVal' ) and not hasattr ( t , '__float__' ) :
-        t.__float__ = lambda s : s.getVal()
+    if _getter_ and not hasattr ( t , '__float__' ) :
+        t.__float__ = t.getVal  ## direct C++ call, no lambda 
 
 
 # =============================================================================
@@ -941,10 +869,11 @@ class SETVAR(object):
     ...    print '3) value %s ' % var.getVal() 
     >>> print '4) value %s ' % var.getVal() 
     """
+    __slots__ = ( 'xvar' , '_old' )
     def __init__  ( self , xvar ) :
         self.xvar = xvar
     def __enter__ ( self        ) :
-        self._old = float ( self.xvar.getVal() ) 
+        self._old = self.xvar.getVal()  ## (double is returned as python float) 
         return self 
     def __exit__  ( self , *_   ) :
         self.xvar.setVal  ( self._old ) 
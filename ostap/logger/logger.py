@@ -47,29 +47,27 @@ FATAL   = 6
 ## some manipulations with logging module
 if not hasattr ( logging , 'VERBOSE' ) : logging.VERBOSE = 5
 
-# =============================================================================
-## Log message with severity 'VERBOSE'
-def _verbose2_(msg, *args, **kwargs):
-    """Log a message with severity 'VERBOSE' on the root logger.
-    """
-    if len(logging.root.handlers) == 0: logging.basicConfig()
-    logging.root.verbose (msg, *args, **kwargs)
-
 # =============================================================================
 ## Log message with severity 'VERBOSE'
 def _verbose1_(self, msg, *args, **kwargs):
     """Log 'msg % args' with severity 'VERBOSE'.
     """
+    ## fast path: the level is disabled globally (the most frequent case)
+    if self.manager.disable >= logging.VERBOSE : return
     if self.isEnabledFor(logging.VERBOSE):
             self._log(logging.VERBOSE, msg, args, **kwargs)
 
 # =============================================================================
 ## Log message with severity 'VERBOSE'
+## the root logger is configured only once, at the first call 
+_root_ready_ = False 
 def _verbose2_(msg, *args, **kwargs):
     """Log a message with severity 'VERBOSE' on the root logger.
     """
-    if len(logging.root.handlers) == 0:
-        logging.basicConfig()
+    global _root_ready_
+    if not _root_ready_ :
+        if not logging.root.handlers : logging.basicConfig()
+        _root_ready_ = True 
     logging.root.verbose (msg, *args, **kwargs)
 
 # =============================================================================
@@ -80,17 +78,23 @@ logging.Logger.verbose = _verbose1_
 ## add method 'verbose' to root logger 
 logging.verbose        = _verbose2_
 
+# =============================================================================
+## MSG::Level -> the level to be disabled for logging 
+_disable_levels_ = {
+    FATAL   : logging.FATAL   - 1 ,
+    ERROR   : logging.ERROR   - 1 ,
+    WARNING : logging.WARNING - 1 ,
+    INFO    : logging.INFO    - 1 ,
+    DEBUG   : logging.DEBUG   - 1 ,
+    VERBOSE : logging.VERBOSE - 1 ,
+    }
 # =============================================================================
 ## convert MSG::Level into logging level 
 def setLogging ( output_level ) :
     """Convert MSG::Level into logging level 
     """
-    if   FATAL   <= output_level : logging.disable ( logging.FATAL   - 1 )
-    elif ERROR   <= output_level : logging.disable ( logging.ERROR   - 1 )
-    elif WARNING <= output_level : logging.disable ( logging.WARNING - 1 )
-    elif INFO    <= output_level : logging.disable ( logging.INFO    - 1 )
-    elif DEBUG   <= output_level : logging.disable ( logging.DEBUG   - 1 )
-    elif VERBOSE <= output_level : logging.disable ( logging.VERBOSE - 1 )
+    level = _disable_levels_.get ( min ( int ( output_level ) , FATAL ) , None )
+    if not level is None : logging.disable ( level )
     
 ## define standard logging names 
 logging.addLevelName ( logging.CRITICAL  , 'FATAL  '  )
@@ -106,6 +110,8 @@ logging.addLevelName ( logging.VERBOSE   , 'VERBOSE'  )
 # - is sys.stdout attached to terminal or not ?
 # - do we run IPYTHON ? 
 from ostap.utils.basic import isatty, with_ipython
+## is sys.stdout attached to terminal? (checked once at the module load)
+__isatty__ = isatty ()
 
 # =============================================================================
 # COLORS: 
@@ -117,19 +123,14 @@ __with_colors__ = False
 def with_colors() :
     """Is colorization enabled ?"""
     global __with_colors__
-    return bool(__with_colors__) and isatty() 
+    return bool(__with_colors__) and __isatty__ 
 # =============================================================================
 ## reset colorization of logging 
 def reset_colors() :
     """Reset colorization of logging 
     >>> reset_colors()
     """
-    logging.addLevelName ( logging.CRITICAL  , 'FATAL  '  )
-    logging.addLevelName ( logging.WARNING   , 'WARNING'  )
-    logging.addLevelName ( logging.DEBUG     , 'DEBUG  '  )
-    logging.addLevelName ( logging.INFO      , 'INFO   '  )
-    logging.addLevelName ( logging.ERROR     , 'ERROR  '  )
-    logging.addLevelName ( logging.VERBOSE   , 'VERBOSE'  )
+    for level , name in _plain_names_ : logging.addLevelName ( level , name )
     #
     global __with_colors__
     __with_colors__ = False 
@@ -154,8 +155,8 @@ def getLogger ( name                                                 ,
     logger.propagate =  False 
     ##logger.propagate =  True
     #
-    while logger.handlers :
-        logger.removeHandler ( logger.handlers[0] )
+    ## remove all existing handlers (removeHandler takes the logging lock)
+    for h in list ( logger.handlers ) : logger.removeHandler ( h )
     #
     if not stream :
         import sys
@@ -278,6 +279,14 @@ def logError   () :
 ## ASCII colors :
 BLACK, RED, GREEN, YELLOW, BLUE, MAGENTA, CYAN, WHITE = range(8)
     
+# =============================================================================
+## ANSI escape sequences (precomputed)
+_RESET_SEQ_ = "\033[0m"
+_BOLD_SEQ_  = "\033[1m"
+_BLINK_SEQ_ = "\033[5m"
+_ULINE_SEQ_ = "\033[4m"
+_FG_SEQ_    = tuple ( "\033[1;%dm" % ( 30 + i ) for i in range ( 8 ) )
+_BG_SEQ_    = tuple ( "\033[1;%dm" % ( 40 + i ) for i in range ( 8 ) )
 # =============================================================================
 ## provide colored string
 #  @code
@@ -293,30 +302,27 @@ def colored_string ( what               ,
     >>> print colored_string ( 'Hello' , foreground = RED , background = YELLOW , bold = True , blink = True , underline = True )
     """
     ## nothing to colorize or no coloring is activated
-    from ostap.utils.basic import isatty
-    if not what or not with_colors() or not isatty() : return what
+    if not what or not with_colors() : return what
 
     ## nothing to do 
     if ( foreground is None ) and ( background is None ) :
         if ( not bold ) and ( not blink ) and ( not underline ) : return what 
 
-    RESET_SEQ = "\033[0m"
-    COLOR_SEQ = "\033[1;%dm"
-    BOLD_SEQ  = "\033[1m"    if bold      else ''
-    BLINK_SEQ = "\033[5m"    if blink     else '' 
-    ULINE_SEQ = "\033[4m"    if underline else '' 
-    
-    fg = COLOR_SEQ % ( 30 + ( foreground % 8 ) ) if not foreground is None else '' 
-    bg = COLOR_SEQ % ( 40 + ( background % 8 ) ) if not background is None else '' 
+    return _colorize_ ( what , foreground , background , bold , blink , underline )
+
+# =============================================================================
+## wrap the string into ANSI escape sequences (no checks) 
+def _colorize_ ( what , foreground , background , bold , blink , underline ) :
+    """Wrap the string into ANSI escape sequences (no checks)
+    """
+    fg = _FG_SEQ_ [ foreground % 8 ] if not foreground is None else '' 
+    bg = _BG_SEQ_ [ background % 8 ] if not background is None else '' 
     
-    return '{foreground}{background}{underline}{bold}{blink}{what}{reset}'.format (
-        foreground = fg        , 
-        background = bg        ,
-        underline  = ULINE_SEQ ,
-        bold       = BOLD_SEQ  , 
-        blink      = BLINK_SEQ , 
-        what       = what      ,
-        reset      = RESET_SEQ )
+    return ( fg + bg                               +
+             ( _ULINE_SEQ_ if underline else '' )  +
+             ( _BOLD_SEQ_  if bold      else '' )  +
+             ( _BLINK_SEQ_ if blink     else '' )  +
+             what + _RESET_SEQ_ )
 
 # =============================================================================
 ## attention!
@@ -341,27 +347,39 @@ def allright ( what ) :
                             underline  = False  )
 
 # =============================================================================
+## the plain names of logging levels 
+_plain_names_ = (
+    ( logging.CRITICAL , 'FATAL  ' ) ,
+    ( logging.WARNING  , 'WARNING' ) ,
+    ( logging.DEBUG    , 'DEBUG  ' ) ,
+    ( logging.INFO     , 'INFO   ' ) ,
+    ( logging.ERROR    , 'ERROR  ' ) ,
+    ( logging.VERBOSE  , 'VERBOSE' ) ,
+    )
+# =============================================================================
+## the colored names of logging levels (the strings are constant: built once)
+#  ( level , name , foreground , background , blink , underline ) 
+_colored_names_ = tuple (
+    ( level , _colorize_ ( name , fg , bg , False , blink , underline ) ) for
+    level , name , fg , bg , blink , underline in (
+        ( logging.CRITICAL , 'FATAL  ' , RED    , BLUE   , True  , False ) , 
+        ( logging.WARNING  , 'WARNING' , RED    , YELLOW , False , True  ) , 
+        ( logging.ERROR    , 'ERROR  ' , YELLOW , RED    , True  , False ) ,
+        ( logging.INFO     , 'INFO   ' , WHITE  , BLUE   , False , False ) ,
+        ( logging.DEBUG    , 'DEBUG  ' , WHITE  , GREEN  , False , False ) ) )
+# =============================================================================
 ## make colors 
 def make_colors () :
     """Colorize logging
     """
     if with_colors() : return
-    if not isatty () : return  ## no colorization for non-TTY output 
+    ## no colorization for non-TTY output (the same cached check as with_colors)
+    if not __isatty__ : return  
     
     global __with_colors__
     __with_colors__ = True 
     
-    def  makeName ( level , fg = None  , bg = None , blink = False , underline = False ) :
-
-        name = logging.getLevelName ( level )
-        bold = fg is None and bg is None and not uderline 
-        return colored_string ( name , fg , bg , bold , blink , underline ) 
-    
-    logging.addLevelName ( logging.CRITICAL ,  makeName ( logging.CRITICAL , fg = RED    , bg  = BLUE   , blink     = True ) )
-    logging.addLevelName ( logging.WARNING  ,  makeName ( logging.WARNING  , fg = RED    , bg  = YELLOW , underline = True ) )
-    logging.addLevelName ( logging.ERROR    ,  makeName ( logging.ERROR    , fg = YELLOW , bg  = RED    , blink     = True ) )
-    logging.addLevelName ( logging.INFO     ,  makeName ( logging.INFO     , bg = BLUE   , fg  = WHITE  ) )
-    logging.addLevelName ( logging.DEBUG    ,  makeName ( logging.DEBUG    , bg = GREEN  , fg  = WHITE  ) )
+    for level , name in _colored_names_ : logging.addLevelName ( level , name )
 
     return with_colors() 
 
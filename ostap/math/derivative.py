@@ -65,18 +65,27 @@ from ostap.math.base  import cpp , iszero , isequal
 from ostap.core.types import num_types , is_integer
 from ostap.math.ve    import VE 
 # =============================================================================
+_fabs_        = math.fabs  ## a bit faster than the builtin abs for floats 
 _next_double_ = cpp.Ostap.Math.next_double
 _mULPs_       = 1000 
+_dmin_        = 2 * float_info.min 
+_dmax_        = 0.5 * float_info.max 
 def _delta_ ( x , ulps = _mULPs_ ) :
+    ax = _fabs_ ( x )
+    ## normal doubles: ulp is 2**(e-53) for x = m*2**e, 0.5<=m<1 (no C++ call)
+    if _dmin_ <= ax <= _dmax_ : return math.ldexp ( ulps , math.frexp ( ax )[1] - 53 )
+    ## zero, denormals, huge and non-finite values 
     n1 = _next_double_ ( x ,  ulps )
     n2 = _next_double_ ( x , -ulps )
-    return max ( abs ( n1 - x ) , abs ( n2 - x ) )
+    return max ( _fabs_ ( n1 - x ) , _fabs_ ( n2 - x ) )
 
 # =============================================================================
 # Four versions:
 
 ## use dot_fma from ostap            ## 17.7s
 dot_fma = cpp.Ostap.Math.dot_fma  
+## both products for the 1st and Nth derivatives in a single pass 
+dot2_fma = cpp.Ostap.Math.dot2_fma
 import array
 ARRAY   = lambda x : array.array ( 'd' , x )
 
@@ -132,6 +141,12 @@ class DeLevie(object) :
         ( ARRAY ( [   -1430 ,   +2002 ,  -1638 ,   +910 ,  -350 ,   +90 ,  -14 ,  +1       ] ) , 2      ) , 
         ( ARRAY ( [   +4862 ,   -7072 ,  +6188 ,  -3808 , +1700 ,  -544 , +119 , -16 , +1  ] ) , 2      ) ]
 
+    ## free buffers for function differences, shared by all instances:
+    #  a buffer is taken for the duration of the call, therefore the nested
+    #  calls (e.g. derivative of derivative) get their own buffers 
+    __pool  = []
+    __nbuf  = len ( __d2h[-1][0] ) 
+    
     ## constructor with the order parameter
     def __init__ ( self , o ) :
 
@@ -145,9 +160,19 @@ class DeLevie(object) :
         self.__sf1         = self.__d1h[ self.__order ][1] 
         self.__d2          = self.__d2h[ self.__order ][0]
         self.__sf2         = self.__d2h[ self.__order ][1]
-        
-        ## vector of function differences 
-        self.__df          = ARRAY ( ( self.__order + 2 ) * [ 0 ] ) 
+
+        ## precomputed inverse scale factors and the power of step for Nth derivative 
+        self.__isf1        = 1.0 / self.__sf1
+        self.__isf2        = 1.0 / self.__sf2
+        self.__npow        = 2 * self.__order + 3 
+
+        ## lengths of the products for 1st and Nth derivatives 
+        self.__n1          = self.__order + 1 
+        self.__n2          = self.__order + 2 
+
+        ## the multipliers of step for the stencil points (1st and Nth derivative)
+        self.__steps1      = tuple ( range ( 1 , self.__order + 2 ) )
+        self.__steps2      = tuple ( range ( 1 , self.__order + 3 ) )
 
     @property
     def order ( self ) :
@@ -171,20 +196,32 @@ class DeLevie(object) :
         - see http://www.ias.ac.in/chemsci/Pdf-Sep2009/935.pdf
         """
 
-        ## calculate differences 
-        imax = self.__order + 2 if der else self.__order + 1
-        i = 0
-        while i < imax : 
-            j = i + 1
-            self.__df[i] = func ( x + j * h ) - func ( x - j * h )
-            i += 1
+        ## get the vector of function differences (single atomic pop)
+        pool = self.__pool
+        try :
+            df = pool.pop ()
+        except IndexError :
+            df = ARRAY ( self.__nbuf * [ 0 ] )
+
+        try : 
+            ## calculate differences 
+            for i , j in enumerate ( self.__steps2 if der else self.__steps1 ) :
+                jh      = j * h 
+                df [ i ] = func ( x + jh ) - func ( x - jh )
+            
+            ## 1) calculate 1st derivative only 
+            if not der :
+                return dot_fma ( self.__n1 , df , self.__d1 ) * self.__isf1 / h 
+            
+            ## 2) calculate 1st and Nth derivatives (single pass over differences) 
+            r  = dot2_fma ( self.__n1 , self.__n2 , df , self.__d1 , self.__d2 )
             
-        ## 1) calculate 1st derivative 
-        result = dot_fma ( self.__order + 1 , self.__df , self.__d1 ) / ( self.__sf1 * h )            
-        if not der : return result 
+        finally :
+            ## the buffer is returned to the pool even if the function fails 
+            pool.append ( df )
             
-        ## 2) calculate Nth derivative 
-        dd     = dot_fma ( self.__order + 2 , self.__df , self.__d2 ) / ( self.__sf2 * h**(self.__order*2+3) ) 
+        result = r.first  * self.__isf1 / h 
+        dd     = r.second * self.__isf2 / h ** self.__npow 
         
         return result, dd 
                             
@@ -221,6 +258,10 @@ _numbers_ = (
     (  51480 , 8.4108e-17 , 1.4656e-1 , 9.0454e-2 ) , ## I=7, J=15 15-point rule 
     ( 218790 , 8.6047e-17 , 1.9873e-1 , 1.2000e-1 ) , ## I=8, J=17 17-point rule 
     )
+## exponents for the optimal step and the error estimate, J = 2*I+1 
+_inv_J_   = tuple ( 1.0 / ( 2 * i + 1 )           for i in range ( 9 ) ) ## 1/J
+_alpha_   = tuple ( 2.0 - 2.0 / ( 2 * i + 1 )     for i in range ( 9 ) ) ## 2-2/J 
+_beta_    = tuple ( 2.0 / ( 2 * i + 1 )           for i in range ( 9 ) ) ## 2/J 
 
 # =============================================================================
 ## Calculate the first derivative for the function
@@ -250,20 +291,43 @@ def derivative ( fun , x , h = 0  , I = 2 , err = False ) :
 
     func = lambda x : float ( fun ( x ) )
     
+    ## adjust the rule 
+    I  = min ( max ( I , 1 ) , 8 )
+
+    return _derivative_ ( func , x , h , I , err )
+
+# =============================================================================
+## Calculate the first derivative for the function (the actual worker)
+#  @param func (INPUT) the function, that returns float 
+#  @param x    (INPUT) the argument
+#  @param h    (INPUT) the guess for the step used in numeric differentiation
+#  @param I    (INPUT) the (already adjusted) rule, 1<=I<=8
+#  @param err  (INPUT) calcualte the uncertainty?
+#  @see derivative 
+def _derivative_ ( func , x , h , I , err ) :
+    """Calculate the first derivative for the function (the actual worker)
+    - func : the function, that returns float
+    - I    : the (already adjusted) rule, 1<=I<=8
+    - see derivative 
+    """
+    
     ## get the function value at the given point 
     f0 = func(x)
 
-    ## adjust the rule 
-    I  = min ( max ( I , 1 ) , 8 )
     J  = 2 * I + 1
     
     _dfun_ = _funcs_[I]
     delta  = _delta_ ( x )
+
+    ## the constants for the given rule (unpacked once)
+    h0                   = _numbers_[0][I]
+    _ , ce , copt , crel = _numbers_[I]
     
     ## if the intial step is too small, choose another one 
-    if abs ( h ) <  _numbers_[I][3] or abs ( h ) < delta :  
-        if iszero( x )  : h    =             _numbers_[0][I]
-        else            : h    = abs ( x ) * _numbers_[I][3] 
+    ah = _fabs_ ( h ) 
+    if ah < crel or ah < delta :  
+        if iszero( x )  : h    =                h0
+        else            : h    = _fabs_ ( x ) * crel 
 
     h = max ( h , 2 * delta )
     
@@ -272,10 +336,10 @@ def derivative ( fun , x , h = 0  , I = 2 , err = False ) :
         
     ## find the optimal step 
     if iszero   ( dJ ) or  ( iszero ( f0 ) and iszero ( x * d1 ) ) :
-        if  iszero ( x )    : hopt =             _numbers_[0][I] 
-        else                : hopt = abs ( x ) * _numbers_[I][3]
+        if  iszero ( x )    : hopt =                h0 
+        else                : hopt = _fabs_ ( x ) * crel
     else : 
-        hopt = _numbers_[I][2] * ( ( abs ( f0 ) + abs ( x * d1 ) ) / abs ( dJ ) )**( 1.0 / J )
+        hopt = copt * ( ( _fabs_ ( f0 ) + _fabs_ ( x * d1 ) ) / _fabs_ ( dJ ) ) ** _inv_J_[I]
 
     ## finally get the derivative 
     if not err  :  return _dfun_ ( func , x , hopt , False )
@@ -283,8 +347,8 @@ def derivative ( fun , x , h = 0  , I = 2 , err = False ) :
     ## estimate the uncertainty, if needed  
     d1,dJ =  _dfun_ ( func , x , hopt , True )
     
-    e     =  _numbers_[I][1] / _numbers_[I][2] * J / ( J - 1 ) 
-    e2    =  e * e * ( J * _eps_ + abs ( f0 ) + abs( x * d1 ) )**( 2 - 2./J ) * abs( dJ )**(2./J) 
+    e     =  ce / copt * J / ( J - 1 ) 
+    e2    =  e * e * ( J * _eps_ + _fabs_ ( f0 ) + _fabs_ ( x * d1 ) ) ** _alpha_[I] * _fabs_ ( dJ ) ** _beta_[I] 
     return VE ( d1 , 4 * e2 ) 
 
 # =============================================================================
@@ -331,6 +395,10 @@ class Derivative(object) :
         self.__order = int  ( order )
         self.__err   = True if err else False 
 
+        ## prepared once: float-wrapper for the function and the adjusted rule 
+        self.__ffunc = lambda x : float ( func ( x ) )
+        self.__rule  = min ( max ( self.__order , 1 ) , 8 )
+
     # =========================================================================
     ## evaluate the derivative
     #  @code 
@@ -348,11 +416,11 @@ class Derivative(object) :
         
         >>> print deriv(0.1) 
         """
-        return derivative ( self.__func  ,
-                            x           ,
-                            self.__step  ,
-                            self.__order ,
-                            self.__err   )
+        return _derivative_ ( self.__ffunc ,
+                              x            ,
+                              self.__step  ,
+                              self.__rule  ,
+                              self.__err   )
 
     @property
     def func ( self ) :
@@ -484,6 +552,8 @@ class Partial(Derivative) :
         
         ## initialize the base 
         Derivative.__init__ ( self , func , step , order , err )
+
+        self.__rule  = min ( max ( self.order , 1 ) , 8 )
         
     # =========================================================================
     ## evaluate the derivative
@@ -502,12 +572,22 @@ class Partial(Derivative) :
         >>> print ' f(%f,%f)=%f    ' % ( x , y , func( x, y ) ) 
         >>> print ' dFdX=%f dFdY=%f' % ( dFdX(x,y), dFdY ( x, y ) )
         """
-        return partial ( self.__index ,
-                         self.func    ,
-                         x            ,
-                         self.step    ,
-                         self.order   ,
-                         self.err     )
+        index = self.__index 
+        if len ( x ) <= index :
+            raise AttributeError("Invalid argument length/index %d/%d" %  ( len(x) , index ) )
+
+        ## the argument list is local for each call (re-entrant & thread-safe)
+        func      = self.func 
+        args      = [ float ( a ) for a in x ]
+        def _wrap ( z ) :
+            args [ index ] = z
+            return float ( func ( *args ) )
+        
+        return _derivative_ ( _wrap          ,
+                              args [ index ] ,
+                              self.step     ,
+                              self.__rule   ,
+                              self.err      )
 
     @property 
     def index ( self ) :
@@ -581,19 +661,21 @@ class EvalVE(object) :
         >>> print 'sin2(x) = %s ' % sin2(x)
         """
         #
+        ## no uncertainties? just evaluate the function 
+        if isinstance ( x , num_types ) : return VE ( self.func_eval ( x , *args ) , 0 )
+        #
         ## 1) evaluate the function 
         val  = self.func_eval ( x , *args )
         #
-        ## no uncertainties? 
-        if   isinstance ( x , num_types          ) : return VE ( val , 0 )
         # ignore small or invalid uncertanties 
-        elif 0 >= x.cov2() or iszero ( x.cov2()  ) : return VE ( val , 0 )
+        xc2  = x.cov2() 
+        if 0 >= xc2 or iszero ( xc2 ) : return VE ( val , 0 )
         #
         ## 2) evaluate the derivative
         dfun = self.__derivative
         d    = dfun (  float ( x ) , *args ) 
         ## 3) calculate the variance 
-        cov2 = d * d * x.cov2()
+        cov2 = d * d * xc2
         ## 4) get a final result 
         return VE ( val , cov2 )
 
@@ -624,6 +706,7 @@ class  EvalNVE(object) :
     >>> x , y  = ...
     >>> result = fun2e ( x , y )  
     """
+    __slots__ = ( '__func' , '__N' , '__partial' , '__name__' ) 
     # =========================================================================
     ## create the object
     #  @param N       the dimensionality of the problem
@@ -744,6 +827,7 @@ class Eval2VE(EvalNVE) :
     >>> eval2 = Eval2VE ( func2 , dFdX = lambda x,y : 2*x , dFdY = lambda x,y : 2*y )
     If derivatves are not provided, numerical differentiation will be used 
     """
+    __slots__ = ()
     ## constructor
     #  @param func  the 2-argument function
     #  @param dFdX  (optional) the partial derivative d(dunc)/dX
@@ -791,20 +875,22 @@ class Eval2VE(EvalNVE) :
         >>> print eval2(x,y,-1) ## treat x,y as 100% anti-correlated
         """
         assert isinstance ( cxy , num_types ) and \
-               ( abs ( cxy ) <= 1 or isequal ( abs ( cxy ) , 1 ) ) , \
+               ( -1 <= cxy <= 1 or isequal ( abs ( cxy ) , 1 ) ) , \
                'Invalid correlation coefficient %s' % cxy 
         
-        x   = VE ( x ) 
-        y   = VE ( y )
-        
-        xv  = x.value()
-        yv  = y.value()
+        ## get values and variances (no VE is created for plain numbers)
+        if   isinstance ( x , num_types ) : xv , xc2 = float ( x ) , 0.0
+        else :
+            if not isinstance ( x , VE )  : x = VE ( x ) 
+            xv , xc2 = x.value () , x.cov2 ()
+            
+        if   isinstance ( y , num_types ) : yv , yc2 = float ( y ) , 0.0
+        else :
+            if not isinstance ( y , VE )  : y = VE ( y ) 
+            yv , yc2 = y.value () , y.cov2 ()
         
         val = self.func ( xv , yv )
 
-        xc2 = x.cov2()
-        yc2 = x.cov2()
-        
         x_plain = xc2 <= 0 or iszero ( xc2 )
         y_plain = yc2 <= 0 or iszero ( yc2 )
         
@@ -820,7 +906,8 @@ class Eval2VE(EvalNVE) :
         
         cov2 = dx * dx * xc2 + dy * dy * yc2
         
-        if cxy and xc2 and yc2 :
+        ## correlation term: only if both arguments have uncertainties 
+        if cxy and not x_plain and not y_plain :
             cov2 += 2 * cxy * dx * dy * math.sqrt ( xc2 * yc2 ) 
             
         return VE ( val , cov2 )
@@ -93,7 +93,11 @@ Ostap = cpp.Ostap
 ## ROOT::Math namespace
 _RM = ROOT.ROOT.Math
 
-a   = Ostap.Math.ValueWithError()
+# =============================================================================
+## already picked up (and decorated) vector and matrix types 
+_vector_types_    = {}
+_matrix_types_    = {}
+_symmatrix_types_ = {}
 # =============================================================================
 ## try to pickup the vector
 @staticmethod
@@ -102,9 +106,13 @@ def _vector_ ( i , typ = 'double' ) :
     >>> V3   = Ostap.Math.Vector(3)
     >>> vct  = V3 ()
     """
-    assert is_integer ( i ) and 0 <= i , 'Invalid vector size %s' % i
-    v = _RM.SVector ( typ , i )
-    return deco_vector ( v ) 
+    key = i , typ 
+    v   = _vector_types_.get ( key , None )
+    if v is None : 
+        assert is_integer ( i ) and 0 <= i , 'Invalid vector size %s' % i
+        v = deco_vector ( _RM.SVector ( typ , i ) )
+        _vector_types_ [ key ] = v
+    return v 
 
 # =============================================================================
 ## try to pickup the matrix
@@ -114,10 +122,14 @@ def _matrix_ ( i , j , typ = 'double' ) :
     >>> M3x4   = Ostap.Math.Matrix(3,4)
     >>> matrix = M3x4 ()    
     """
-    assert is_integer ( i ) and 0 <= i , 'Invalid matrix size (%s,%s)' % ( i , j )
-    assert is_integer ( j ) and 0 <= j , 'Invalid matrix size (%s,%s)' % ( i , j )
-    m = _RM.SMatrix ( "%s,%d,%d" % ( typ , i , j ) )
-    return deco_matrix( m )  
+    key = i , j , typ 
+    m   = _matrix_types_.get ( key , None )
+    if m is None : 
+        assert is_integer ( i ) and 0 <= i , 'Invalid matrix size (%s,%s)' % ( i , j )
+        assert is_integer ( j ) and 0 <= j , 'Invalid matrix size (%s,%s)' % ( i , j )
+        m = deco_matrix ( _RM.SMatrix ( "%s,%d,%d" % ( typ , i , j ) ) )
+        _matrix_types_ [ key ] = m
+    return m 
 
 # =============================================================================
 ## try to pickup the symmeric matrix
@@ -127,9 +139,14 @@ def _sym_matrix_ ( i , typ = 'double' ) :
     >>> SymM3  = Ostap.Math.SymMatrix(3)
     >>> matrix = SymM3 ()
     """
-    assert is_integer ( i ) and 0 <= i , 'Invalid matrix size %s' %  i 
-    m = _RM.SMatrix('%s,%d,%d,ROOT::Math::MatRepSym<%s,%d>' %  ( typ , i , i , typ , i ) )
-    return deco_symmatrix  ( m ) 
+    key = i , typ 
+    m   = _symmatrix_types_.get ( key , None )
+    if m is None : 
+        assert is_integer ( i ) and 0 <= i , 'Invalid matrix size %s' %  i 
+        m = _RM.SMatrix('%s,%d,%d,ROOT::Math::MatRepSym<%s,%d>' %  ( typ , i , i , typ , i ) )
+        m = deco_symmatrix ( m )
+        _symmatrix_types_ [ key ] = m 
+    return m 
 
 Ostap.Vector         =     _vector_
 Ostap.Math.Vector    =     _vector_
@@ -384,9 +401,12 @@ def _vector_eq_ ( a , b ) :
     #
     ops = _get_eq_op_ ( a.__class__ , b.__class__ )
     if ops : return ops.equal ( a , b )  ## RETURN
-    ## compare elements  
-    for i in range ( len( a ) ) :
-        if not isequal ( a[i] , b[i] ) : return False
+    ## compare elements (the vector storage is read at once)
+    if a.kSize :
+        buf = a.Array ()
+        buf.SetSize ( a.kSize )
+        for ai , bi in zip ( buf , b ) :
+            if not isequal ( ai , bi ) : return False
         
     return True 
     
@@ -490,6 +510,37 @@ Ostap.Math.Vectors2       = Ostap.Vectors2
 Ostap.Math.Vectors3       = Ostap.Vectors3
 Ostap.Math.Vectors4       = Ostap.Vectors4
 
+# ============================================================================
+## get all matrix elements (row-major) with a single read of the storage
+#  - for symmetric matrices the packed storage is expanded 
+#  @code
+#  matrix = ...
+#  values = _m_values_ ( matrix )
+#  @endcode 
+def _m_values_ ( m ) :
+    """Get all matrix elements (row-major) with a single read of the storage
+    - for symmetric matrices the packed storage is expanded 
+    >>> matrix = ...
+    >>> values = _m_values_ ( matrix )
+    """
+    rows = m.kRows
+    cols = m.kCols
+    ## note: SMatrix::kSize is always D1*D2, even for the packed symmetric storage 
+    sym  = getattr ( m , '_symmetric_' , False )
+    size = rows * ( rows + 1 ) // 2 if sym else rows * cols 
+    if not size : return []
+    #
+    buf  = m.Array ()
+    buf.SetSize ( size )
+    vals = list ( buf )
+    #
+    if not sym : return vals
+    #
+    ## symmetric matrix: packed lower triangle, (i,j) -> i*(i+1)/2+j for j<=i 
+    off  = [ i * ( i + 1 ) // 2 for i in range ( rows ) ]
+    return [ vals [ off [ i ] + j ] if j <= i else vals [ off [ j ] + i ]
+             for i in range ( rows ) for j in range ( cols ) ]
+    
 # ============================================================================
 ## self-printout of matrices
 def _mg_str_ ( self , fmt = ' %+11.4g') :
@@ -497,16 +548,10 @@ def _mg_str_ ( self , fmt = ' %+11.4g') :
     >>> matrix = ...
     >>> print matrix 
     """
-    _rows = self.kRows
     _cols = self.kCols
-    _line = ''
-    for _irow in range ( 0 , _rows ) :
-        _line += ' |'
-        for _icol in range ( 0 , _cols ) :
-            _line += fmt % self( _irow , _icol )
-        _line += ' |'
-        if ( _rows - 1 )  != _irow : _line += '\n'
-    return _line
+    _vals = _m_values_ ( self ) 
+    return '\n'.join ( ' |' + ''.join ( fmt % v for v in _vals [ i * _cols : ( i + 1 ) * _cols ] ) + ' |'
+                       for i in range ( self.kRows ) )
 
 # =============================================================================
 ## self-printout of symmetrical matrices
@@ -515,17 +560,16 @@ def _ms_str_ ( self , fmt = ' %+11.4g' , width = 12 ) :
     >>> matrix = ...
     >>> print matrix 
     """
-    _rows = self.kRows
-    _cols = self.kCols
-    _line = ''
+    _rows  = self.kRows
+    _cols  = self.kCols
+    _vals  = _m_values_ ( self ) 
+    _blank = width * ' '
+    _lines = []
     for _irow in range ( 0 , _rows ) :
-        _line += ' |'
-        for _icol in range ( 0 , _cols  ) :
-            if _icol < _irow : _line += width*' '
-            else             : _line += fmt % self( _irow , _icol )
-        _line += ' |'
-        if ( _rows - 1 )  != _irow : _line += '\n'
-    return _line
+        _row = _vals [ _irow * _cols : ( _irow + 1 ) * _cols ]
+        _lines.append ( ' |' + _irow * _blank
+                        + ''.join ( fmt % v for v in _row [ _irow : ] ) + ' |' )
+    return '\n'.join ( _lines )
 
 # =============================================================================
 ## get the correlation matrix
@@ -539,11 +583,12 @@ def _ms_corr_ ( self ) :
     _t    = type ( self )
     _c    = _t   ()
     _rows = self.kRows
+    _vals = _m_values_ ( self )              ## single read of the matrix 
     _ok1  = True 
     _ok2  = True 
     for i in range ( 0 , _rows ) :
         
-        ii  = self  ( i , i )
+        ii  = _vals [ i * _rows + i ]
         if 0 > ii or iszero ( ii ) :
             _ok1  = False 
             _nan = float('nan')
@@ -554,9 +599,9 @@ def _ms_corr_ ( self ) :
         _c[ i , i ] = 1
         
         for j in range ( i + 1 , _rows ) :            
-            jj  = self ( j , j ) 
+            jj  = _vals [ j * _rows + j ] 
             sjj = sqrt ( jj )
-            ij  = self ( i , j )
+            ij  = _vals [ i * _rows + j ] 
             eij = ij / ( sii * sjj )
             if  1 < abs ( eij ) : _ok2 = False  
             _c [ i , j ] = eij 
@@ -595,9 +640,11 @@ def _mg_increment_ ( m , o ) :
     >>> o = ...
     >>> m.increment  ( o ) 
     """
+    cols = m.kCols
+    vals = _m_values_ ( m ) 
     for i in range ( m.kRows ) :
-        for j in range ( m.kCols ) :
-            m[i,j] = m(i,j) + _m_get_ ( o , i , j )
+        for j in range ( cols ) :
+            m[i,j] = vals [ i * cols + j ] + _m_get_ ( o , i , j )
                     
     return m
 
@@ -615,9 +662,11 @@ def _ms_increment_ ( m , o ) :
     >>> o = ...
     >>> m.increment  ( o ) 
     """
+    cols = m.kCols
+    vals = _m_values_ ( m ) 
     for i in range ( m.kRows ) :
-        for j in range ( i , m.kCols ) :
-            m[i,j] = m(i,j) + 0.5 * ( _m_get_ ( o , i , j ) + _m_get_ ( o , j , i ) )  
+        for j in range ( i , cols ) :
+            m[i,j] = vals [ i * cols + j ] + 0.5 * ( _m_get_ ( o , i , j ) + _m_get_ ( o , j , i ) )  
                     
     return m
 
@@ -632,9 +681,7 @@ def _m_iter_ ( self ) :
     >>> matrix = ...
     >>> for i in matrix : print i 
     """
-    for i in range(self.kRows) :
-        for j in range(self.kCols) :
-            yield self(i,j)
+    for v in _m_values_ ( self ) : yield v
 
 # =============================================================================
 ## iterator for SMatrix
@@ -647,9 +694,9 @@ def _m_iteritems_ ( self ) :
     >>> matrix = ...
     >>> for i,j,v in matrix.iteritems() : print i,j,v
     """
-    for i in range(self.kRows) :
-        for j in range(self.kCols) :
-            yield i,j,self(i,j)
+    cols = self.kCols
+    for k , v in enumerate ( _m_values_ ( self ) ) :
+        yield k // cols , k % cols , v
 
 # =============================================================================
 ## convert matrix into numpy.matrix
@@ -683,10 +730,13 @@ def  _ms_sim_ ( m , v ) :
     >>> v = ...
     >>> m.sim ( v )
     """
-    sim = 0.0
-    for i in range(m.kRows) :
-        for j in range(m.kCols) :
-            sim += v[i]*m(i,j)*v[j] 
+    n    = m.kRows 
+    vals = _m_values_ ( m )                   ## single read of the matrix 
+    vv   = [ v [ i ] for i in range ( n ) ]   ## single read of the vector 
+    sim  = 0.0
+    for i in range ( n ) :
+        row  = vals [ i * n : ( i + 1 ) * n ]
+        sim += vv [ i ] * sum ( mij * vj for mij , vj in zip ( row , vv ) )
     return sim 
 
 
@@ -777,6 +827,7 @@ def deco_matrix ( m  ) :
         m.__contains__ = lambda s,ij : 0<=ij[0]<s.kRows and 0<=ij[1]<s.kCols
 
         m.to_numpy     = _m_to_numpy_ 
+        m._symmetric_  = False 
         m._decorated   = True
         
     return m
@@ -836,6 +887,7 @@ def deco_symmatrix ( m ) :
             m.eigenVectors = _eigen_2_
         
         m.to_numpy     = _m_to_numpy_
+        m._symmetric_  = True      ## packed storage: N*(N+1)/2 elements 
         m._decorated   = True
         
     return m
@@ -859,17 +911,16 @@ Ostap.Math.SymMatrix7x7   = Ostap.SymMatrix7x7
 Ostap.Math.SymMatrix8x8   = Ostap.SymMatrix8x8
 Ostap.Math.SymMatrix9x9   = Ostap.SymMatrix9x9
 
-for i in range(11) :
-    
-    t0 = Ostap.Vector ( i )
-    deco_vector    ( t0 )
+## decorate the most common types in advance:
+#  - the factories Ostap.Vector/Matrix/SymMatrix decorate the types themselves
+#    (and any other size on demand), no need to decorate them once again
+#  - degenerate zero-size types are not instantiated at import 
+for i in range ( 1 , 11 ) :
     
-    t1 = Ostap.SymMatrix(i)
-    deco_symmatrix ( t1 )
+    Ostap.Vector    ( i )
+    Ostap.SymMatrix ( i )
     
-    for j in range(11) : 
-        t2 = Ostap.Matrix(i,j)
-        deco_matrix ( t2 ) 
+    for j in range ( 1 , 11 ) : Ostap.Matrix ( i , j )
 
 # =============================================================================
 _decorated_classes_ = (
@@ -930,7 +981,7 @@ if '__main__' == __name__ :
     
     l3[0]    = 1
     l3[1]    = 2
-    l3[1]    = 3
+    l3[2]    = 3
     
     logger.info ( 'l2 , l3 : %s %s '  % ( l2 , l3  ) )
     
@@ -69,10 +69,115 @@ def test_derivative ():
         print I , cnt  [I]
         
         
+# =============================================================================
+## the derivatives of known functions 
+def test_derivative_known ():
+
+    import math 
+    from ostap.math.derivative import derivative, Derivative
+
+    functions = [
+        ( math.sin                     , math.cos                                , 0.5 ) ,
+        ( lambda x : x**3              , lambda x : 3.0*x*x                      , 1.0 ) , 
+        ( math.exp                     , math.exp                                , 2.0 ) ,
+        ( lambda x : math.tanh(2.*x)   , lambda x : 2*(1.-math.tanh(2.*x)**2)    , 0.3 ) ,
+        ( lambda x : 1./x              , lambda x : -1./(x*x)                    , 1.5 ) ,
+        ]
+    
+    for f , d , x in functions :
+        
+        dt  = d ( x )
+        tol = 1.e-6 * max ( 1.0 , abs ( dt ) )
+        for I in range ( 1 , 9 ) :
+            
+            d1 = derivative ( f , x , I = I )
+            d2 = Derivative ( f , order = I ) ( x ) 
+            d3 = derivative ( f , x , I = I , err = True )
+            
+            assert abs ( d1 - dt ) < tol , 'derivative(I=%d)  %s/%s' % ( I , d1 , dt )
+            assert abs ( d2 - dt ) < tol , 'Derivative(I=%d)  %s/%s' % ( I , d2 , dt )
+            assert abs ( d1 - d2 ) <= 1.e-12 * max ( 1.0 , abs ( dt ) ) , \
+                   'derivative/Derivative mismatch(I=%d) %s/%s' % ( I , d1 , d2 )
+            assert abs ( d3.value() - dt ) < tol and 0 <= d3.cov2() , \
+                   'derivative(I=%d,err=True) %s/%s' % ( I , d3 , dt )
+
+    logger.info ( 'Derivatives of known functions: OK' ) 
+
+# =============================================================================
+## partial derivatives, including the re-entrant call 
+def test_partial ():
+
+    from ostap.math.derivative import partial, Partial 
+
+    func = lambda x , y : x * x * y + 3 * y 
+    dFdX = Partial ( 0 , func )
+    dFdY = Partial ( 1 , func )
+    
+    for x , y in ( ( 1.0 , 2.0 ) , ( -0.5 , 3.0 ) , ( 2.0 , -1.0 ) ) :
+        assert abs ( dFdX ( x , y ) - 2 * x * y ) < 1.e-6 , 'Partial(0) %s' % dFdX ( x , y ) 
+        assert abs ( dFdY ( x , y ) - x * x - 3 ) < 1.e-6 , 'Partial(1) %s' % dFdY ( x , y ) 
+        assert abs ( partial ( 0 , func , ( x , y ) ) - dFdX ( x , y ) ) < 1.e-12 , 'partial/Partial mismatch'
+
+    ## the function that evaluates the same Partial object at other point 
+    depth = [ 0 ] 
+    def func2 ( x , y ) :
+        r = x * x * y
+        if not depth [ 0 ] :
+            depth [ 0 ] = 1
+            try     : r += 0.0 * dF2 ( y , x )
+            finally : depth [ 0 ] = 0
+        return r
+    dF2 = Partial ( 0 , func2 )
+    assert abs ( dF2 ( 1.5 , 2.0 ) - 6.0 ) < 1.e-6 , 'Re-entrant Partial %s' % dF2 ( 1.5 , 2.0 )
+    
+    logger.info ( 'Partial derivatives: OK' ) 
+
+# =============================================================================
+## propagation of uncertainties 
+def test_eval_ve ():
+
+    import math 
+    from ostap.math.ve         import VE 
+    from ostap.math.derivative import EvalVE, Eval2VE
+
+    ## 1D
+    sin1 = EvalVE ( math.sin , math.cos )
+    sin2 = EvalVE ( math.sin )
+    x    = VE ( 0.5 , 0.1**2 )
+    for s in ( sin1 , sin2 ) :
+        r = s ( x )
+        assert abs ( r.value () - math.sin ( 0.5 )           ) < 1.e-12 , 'EvalVE value %s' % r 
+        assert abs ( r.error () - 0.1 * math.cos ( 0.5 )     ) < 1.e-8  , 'EvalVE error %s' % r 
+        assert 0 == s ( 0.5 ).cov2 ()                                    , 'EvalVE for number' 
+
+    ## 2D with (anti)correlated arguments:  f = x*y 
+    func = lambda x , y : x * y 
+    e1   = Eval2VE ( func )
+    e2   = Eval2VE ( func , dFdX = lambda x , y : y , dFdY = lambda x , y : x )
+    x    = VE ( 1.0 , 0.1**2 )
+    y    = VE ( 2.0 , 0.3**2 )        ## different uncertainty for y 
+    for c in ( 0 , 0.5 , 1 , -1 ) :
+        cov2 = ( 2.0 * 0.1 ) ** 2 + ( 1.0 * 0.3 ) ** 2 + 2 * c * 2.0 * 1.0 * 0.1 * 0.3 
+        for e in ( e1 , e2 ) :
+            r = e ( x , y , c ) 
+            assert abs ( r.value () - 2.0  ) < 1.e-12 , 'Eval2VE value %s'           % r 
+            assert abs ( r.cov2  () - cov2 ) < 1.e-8  , 'Eval2VE cov2 (c=%s) %s/%s' % ( c , r.cov2 () , cov2 ) 
+
+    ## one of arguments is a plain number: no correlation term 
+    r = e1 ( x , 2.0 , 1 )
+    assert abs ( r.cov2 () - ( 2.0 * 0.1 ) ** 2 ) < 1.e-8 , 'Eval2VE with number %s' % r
+    r = e1 ( 1.0 , 2.0 )
+    assert 0 == r.cov2 () , 'Eval2VE with numbers %s' % r
+
+    logger.info ( 'Uncertainty propagation: OK' ) 
+        
 # =============================================================================
 if '__main__' == __name__ :
 
-    test_derivative ()
+    test_derivative       ()
+    test_derivative_known ()
+    test_partial          ()
+    test_eval_ve          ()
     
 # =============================================================================
 # The END 
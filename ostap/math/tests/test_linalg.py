@@ -0,0 +1,115 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+# =============================================================================
+# Copyright (c) Ostap developpers.
+# =============================================================================
+## @file ostap/math/tests/test_linalg.py
+#  Test module for the file ostap/math/linalg.py
+# =============================================================================
+""" Test module for ostap/math/linalg.py
+
+It tests the element access, printout and iteration for (symmetric) matrices
+"""
+# =============================================================================
+# logging
+# =============================================================================
+from ostap.logger.logger import getLogger
+if '__main__' ==  __name__ : logger = getLogger ( 'test_linalg' )
+else                       : logger = getLogger ( __name__      )
+# =============================================================================
+import ostap.math.linalg
+from   ostap.core.core  import Ostap
+from   ostap.math.base  import isequal
+
+# =============================================================================
+## fill the symmetric matrix with distinct values
+def _sym_ ( N ) :
+    m = Ostap.Math.SymMatrix ( N ) ()
+    for i in range ( N ) :
+        for j in range ( i , N ) :
+            m [ i , j ] = 1.0 + 10 * i + j
+    return m
+
+# =============================================================================
+## single read of the storage must agree with element access
+def test_linalg_values () :
+
+    from ostap.math.linalg import _m_values_
+
+    for N in ( 1 , 2 , 3 , 5 ) :
+
+        s = _sym_ ( N )
+        v = _m_values_ ( s )
+        assert len ( v ) == N * N , 'Invalid number of elements %d/%d' % ( len ( v ) , N * N )
+        for i in range ( N ) :
+            for j in range ( N ) :
+                assert isequal ( v [ i * N + j ] , s ( i , j ) ), \
+                       'Invalid (%d,%d) element of SymMatrix(%d): %s/%s' % ( i , j , N , v [ i * N + j ] , s ( i , j ) )
+
+        m = Ostap.Math.Matrix ( N , N + 1 ) ()
+        for i in range ( N ) :
+            for j in range ( N + 1 ) :
+                m [ i , j ] = 1.0 + 10 * i + j
+        v = _m_values_ ( m )
+        assert len ( v ) == N * ( N + 1 ) , 'Invalid number of elements'
+        for i in range ( N ) :
+            for j in range ( N + 1 ) :
+                assert isequal ( v [ i * ( N + 1 ) + j ] , m ( i , j ) ), \
+                       'Invalid (%d,%d) element of Matrix(%d,%d)' % ( i , j , N , N + 1 )
+
+# =============================================================================
+## printout, iteration, correlations and similarity for symmetric matrices 
+def test_linalg_symmatrix () :
+
+    import math 
+    N = 3 
+    s = Ostap.Math.SymMatrix ( N ) ()
+    for i in range ( N ) :
+        s [ i , i ] = 10.0 + i
+        for j in range ( i + 1 , N ) :
+            s [ i , j ] = 1.0 + i + 0.5 * j
+
+    ## iteration 
+    elems = [ s ( i , j ) for i in range ( N ) for j in range ( N ) ]
+    assert list ( s ) == elems , 'Invalid iteration over SymMatrix'
+    for i , j , v in s.iteritems () :
+        assert v == s ( i , j ) and v == s ( j , i ) , 'Invalid iteritems for SymMatrix (%d,%d)' % ( i , j ) 
+
+    ## printout: only the upper triangle is shown 
+    lines = str ( s ).split ( '\n' )
+    assert N == len ( lines ) , 'Invalid printout for SymMatrix:\n%s' % s 
+    for i , line in enumerate ( lines ) :
+        row = [ float ( w ) for w in line.replace ( '|' , ' ' ).split () ]
+        assert row == [ float ( ' %+11.4g' % s ( i , j ) ) for j in range ( i , N ) ] , \
+               'Invalid row %d in SymMatrix printout:\n%s' % ( i , s ) 
+
+    ## correlations 
+    c = s.correlations ()
+    for i in range ( N ) :
+        for j in range ( N ) :
+            cij = s ( i , j ) / math.sqrt ( s ( i , i ) * s ( j , j ) )
+            assert abs ( c ( i , j ) - cij ) < 1.e-12 , 'Invalid correlation (%d,%d)' % ( i , j ) 
+
+    ## similarity 
+    v   = Ostap.Math.Vector ( N ) ()
+    for i in range ( N ) : v [ i ] = 1.0 - 0.5 * i 
+    sim = sum ( v [ i ] * s ( i , j ) * v [ j ] for i in range ( N ) for j in range ( N ) )
+    assert abs ( s.sim ( v ) - sim ) < 1.e-12 , 'Invalid similarity %s/%s' % ( s.sim ( v ) , sim )
+
+    ## increment keeps the symmetry 
+    s2 = s.__class__ ( s )
+    s2.increment ( s )
+    for i , j , v in s2.iteritems () :
+        assert abs ( v - 2 * s ( i , j ) ) < 1.e-12 , 'Invalid increment (%d,%d)' % ( i , j ) 
+
+    logger.info ( 'SymMatrix(%d):\n%s' % ( N , s ) )
+
+# =============================================================================
+if '__main__' == __name__ :
+
+    test_linalg_values    ()
+    test_linalg_symmatrix ()
+
+# =============================================================================
+# The END
+# =============================================================================
@@ -0,0 +1,105 @@
+// ============================================================================
+#ifndef OSTAP_DATAUTILS_H 
+#define OSTAP_DATAUTILS_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// Forward declarations 
+// ============================================================================
+class RooAbsData ;
+class RooArgList ;
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace Utils 
+  {
+    // ========================================================================
+    /** copy the entries with the given indices from the source dataset 
+     *  into the target dataset (e.g. the empty clone of the source)
+     *  - the entries are copied in the order of indices 
+     *  - the weights of entries are propagated 
+     *  - invalid indices are ignored 
+     *  @param source  (INPUT)  the source dataset 
+     *  @param target  (UPDATE) the target dataset 
+     *  @param indices (INPUT)  the array of indices 
+     *  @param size    (INPUT)  the length of the array of indices 
+     *  @return number of copied entries 
+     */
+    unsigned long subset 
+    ( const RooAbsData*    source  , 
+      RooAbsData*          target  , 
+      const unsigned long* indices , 
+      const unsigned long  size    ) ;
+    // ========================================================================
+    /** (partial) random Fisher-Yates shuffle of the array of indices 
+     *  - the first <code>num</code> elements are shuffled, 
+     *    they represent the random sample (without replacement) 
+     *    from the whole array 
+     *  - for <code>num</code> equal or larger than <code>size</code>
+     *    the whole array is shuffled 
+     *  @param indices (UPDATE) the array of indices 
+     *  @param size    (INPUT)  the length of the array of indices 
+     *  @param num     (INPUT)  number of elements to be shuffled 
+     *  @param seed    (INPUT)  the seed for the random number generator 
+     */
+    void shuffle 
+    ( unsigned long*       indices , 
+      const unsigned long  size    , 
+      const unsigned long  num     , 
+      const unsigned long  seed    ) ;
+    // ========================================================================
+    /** sort the array of indices (in place) in increasing order,
+     *  e.g. to get the sequential access to the dataset entries 
+     *  @param indices (UPDATE) the array of indices 
+     *  @param size    (INPUT)  the length of the array of indices 
+     */
+    void sort 
+    ( unsigned long*       indices , 
+      const unsigned long  size    ) ;
+    // ========================================================================
+    /** random (Bernoulli) selection of indices from <code>[0,size)</code>:
+     *  each index is selected with the given probability 
+     *  - the selected indices are written (in increasing order) 
+     *    into the first elements of the array 
+     *  @param indices  (OUTPUT) the array of (at least) <code>size</code> elements 
+     *  @param size     (INPUT)  the length of the array of indices 
+     *  @param fraction (INPUT)  the probability to select the index 
+     *  @param seed     (INPUT)  the seed for the random number generator 
+     *  @return number of selected indices 
+     */
+    unsigned long select
+    ( unsigned long*       indices  , 
+      const unsigned long  size     , 
+      const double         fraction , 
+      const unsigned long  seed     ) ;
+    // ========================================================================
+    /** fill the target dataset (e.g. the empty clone of the source) 
+     *  with the entries of the source dataset, where the values of the 
+     *  specified variables are taken from the flat (N,k) block of doubles
+     *  - <code>vars</code> are the (real) variables of the <b>target</b> dataset
+     *  - the row <code>i</code> of the block provides the values of 
+     *    <code>vars</code> for the entry <code>i</code> of the source 
+     *  - the weights of entries are propagated 
+     *  @param source  (INPUT)  the source dataset 
+     *  @param target  (UPDATE) the target dataset 
+     *  @param vars    (INPUT)  the variables (k) to be replaced 
+     *  @param block   (INPUT)  the (N,k) block of values 
+     *  @param size    (INPUT)  number of rows (N) in the block 
+     *  @return number of added entries 
+     */
+    unsigned long fill
+    ( const RooAbsData*    source  , 
+      RooAbsData*          target  , 
+      const RooArgList&    vars    , 
+      const double*        block   , 
+      const unsigned long  size    ) ;
+    // ========================================================================
+  } //                                        The end of namespace Ostap::Utils
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
+#endif // OSTAP_DATAUTILS_H
+// ============================================================================
@@ -12,6 +12,7 @@
 #include <vector>
 #include <array>
 #include <type_traits>
+#include <utility>
 // ============================================================================
 // Ostap
 // ============================================================================
@@ -913,6 +914,37 @@ namespace Ostap
       const double*      x , 
       const double*      y ) { return dot_fma ( x , x + N , y ) ; }
     // ========================================================================
+    /** make two dot-multiplications of the sequence with two other 
+     *  sequences in a single pass using std::fma 
+     *  \f$ r_1 = \sum_{i<N_1}  x_i y_{1,i} \f$,  
+     *  \f$ r_2 = \sum_{i<N_2}  x_i y_{2,i} \f$ 
+     *  @param N1 (INPUT) length of the first  product 
+     *  @param N2 (INPUT) length of the second product 
+     *  @param x  (INPUT) the common sequence 
+     *  @param y1 (INPUT) the sequence for the first  product 
+     *  @param y2 (INPUT) the sequence for the second product 
+     *  @return   pair of "dot" products 
+     *  @see Ostap::Math::dot_fma
+     */
+    inline std::pair<double,double> dot2_fma 
+    ( const unsigned int N1 , 
+      const unsigned int N2 , 
+      const double*      x  , 
+      const double*      y1 , 
+      const double*      y2 ) 
+    {
+      long double dot1 = 0 ;
+      long double dot2 = 0 ;
+      const unsigned int N = std::max ( N1 , N2 ) ;
+      for ( unsigned int i = 0 ; i < N ; ++i ) 
+      {
+        const long double xi = x[i] ;
+        if ( i < N1 ) { dot1 = std::fma ( xi , (long double) y1[i] , dot1 ) ; }
+        if ( i < N2 ) { dot2 = std::fma ( xi , (long double) y2[i] , dot2 ) ; }
+      }
+      return std::make_pair ( (double) dot1 , (double) dot2 ) ;
+    }
+    // ========================================================================
     /** Kahan summation 
      *  @see https://en.wikipedia.org/wiki/Kahan_summation_algorithm
      *  \f$ r = \sum_i x_i \f$ 
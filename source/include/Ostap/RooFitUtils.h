@@ -0,0 +1,64 @@
+// ============================================================================
+#ifndef OSTAP_ROOFITUTILS_H 
+#define OSTAP_ROOFITUTILS_H 1
+// ============================================================================
+// Include files
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <utility>
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/ValueWithError.h"
+// ============================================================================
+// Forward declarations 
+// ============================================================================
+class RooAbsReal       ;
+class RooRealVar       ;
+class RooAbsCollection ;
+// ============================================================================
+namespace Ostap
+{
+  // ==========================================================================
+  namespace Utils 
+  {
+    // ========================================================================
+    /** get the value with error for the RooRealVar (in a single call)
+     *  - the error is ignored for the constant variables 
+     *  @param var (INPUT) the variable 
+     *  @return value with error 
+     */
+    Ostap::Math::ValueWithError valueWithError ( const RooRealVar& var ) ;
+    // ========================================================================
+    /** get the value and the error of the variable (in a single call)
+     *  - the error is taken from RooRealVar and it is zero otherwise 
+     *  @param var (INPUT) the variable 
+     *  @return (value,error) pair 
+     */
+    std::pair<double,double> valueAndError ( const RooAbsReal& var ) ;
+    // ========================================================================
+    /** get the values and errors of all variables from the collection 
+     *  (in a single loop)
+     *  - for non-real elements the value is NaN 
+     *  - the error is zero for elements other than RooRealVar 
+     *  @param vars   (INPUT)  the collection of variables 
+     *  @param values (OUTPUT) the array of values 
+     *  @param errors (OUTPUT) the array of errors 
+     *  @param size   (INPUT)  the length of arrays 
+     *  @return number of processed elements 
+     */
+    unsigned long valuesErrors 
+    ( const RooAbsCollection& vars   , 
+      double*                 values , 
+      double*                 errors , 
+      const unsigned long     size   ) ;
+    // ========================================================================
+  } //                                        The end of namespace Ostap::Utils
+  // ==========================================================================
+} //                                                 The end of namespace Ostap
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
+#endif // OSTAP_ROOFITUTILS_H
+// ============================================================================
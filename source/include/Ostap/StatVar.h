@@ -283,6 +283,28 @@ namespace Ostap
       const unsigned long first      = 0    ,
       const unsigned long last       = LAST ) ;
     // ========================================================================
+    /** build statistic for the <code>expressions</code> (in a single loop)
+     *  @param data        (INPUT)  the data 
+     *  @param result      (UPDATE) the output statistics for specified expressions 
+     *  @param expressions (INPUT)  the list of  expressions
+     *  @param cuts        (INPUT)  the selection criteria 
+     *  @param first       (INPUT)  the first entry to process 
+     *  @param last        (INPUT)  the last entry to process (not including!)
+     *  @return number of processed entries 
+     *
+     *  @code
+     *  data  = ... 
+     *  stats = data.statVars( [ 'pt' , 'eta' ] , 'p>10' ) 
+     *  @endcode 
+     */
+    static unsigned long statVars
+    ( const RooAbsData*               data               , 
+      std::vector<Statistic>&         result             , 
+      const std::vector<std::string>& expressions        ,
+      const std::string&              cuts        = ""   ,
+      const unsigned long             first       = 0    ,
+      const unsigned long             last        = LAST ) ;
+    // ========================================================================
   public:
     // ========================================================================
     /** build statistic for the <code>expression</code>
@@ -0,0 +1,179 @@
+// ============================================================================
+// Include files 
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <random>
+#include <utility>
+#include <algorithm>
+#include <vector>
+// ============================================================================
+// ROOT/RooFit
+// ============================================================================
+#include "RooArgSet.h"
+#include "RooArgList.h"
+#include "RooAbsRealLValue.h"
+#include "RooAbsData.h"
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/DataUtils.h"
+// ============================================================================
+/** @file 
+ *  Implementation file for functions from the file Ostap/DataUtils.h
+ *  @see Ostap::Utils::subset
+ *  @see Ostap::Utils::shuffle
+ *  @see Ostap::Utils::sort
+ *  @see Ostap::Utils::select
+ *  @see Ostap::Utils::fill
+ */
+// ============================================================================
+/*  copy the entries with the given indices from the source dataset 
+ *  into the target dataset (e.g. the empty clone of the source)
+ *  @param source  (INPUT)  the source dataset 
+ *  @param target  (UPDATE) the target dataset 
+ *  @param indices (INPUT)  the array of indices 
+ *  @param size    (INPUT)  the length of the array of indices 
+ *  @return number of copied entries 
+ */
+// ============================================================================
+unsigned long Ostap::Utils::subset 
+( const RooAbsData*    source  , 
+  RooAbsData*          target  , 
+  const unsigned long* indices , 
+  const unsigned long  size    ) 
+{
+  if ( nullptr == source || nullptr == target || nullptr == indices ) { return 0 ; }
+  //
+  const unsigned long num   = source->numEntries() ;
+  unsigned long       added = 0 ;
+  for ( unsigned long i = 0 ; i < size ; ++i ) 
+  {
+    const unsigned long index = indices [ i ] ;
+    if ( num <= index    ) { continue ; }
+    const RooArgSet* entry = source->get ( index ) ;
+    if ( nullptr == entry ) { continue ; }
+    target->add ( *entry , source->weight() ) ;
+    ++added ;
+  }
+  //
+  return added ;
+}
+// ============================================================================
+/*  (partial) random Fisher-Yates shuffle of the array of indices 
+ *  @param indices (UPDATE) the array of indices 
+ *  @param size    (INPUT)  the length of the array of indices 
+ *  @param num     (INPUT)  number of elements to be shuffled 
+ *  @param seed    (INPUT)  the seed for the random number generator 
+ */
+// ============================================================================
+void Ostap::Utils::shuffle 
+( unsigned long*       indices , 
+  const unsigned long  size    , 
+  const unsigned long  num     , 
+  const unsigned long  seed    ) 
+{
+  if ( nullptr == indices || size < 2 ) { return ; }
+  //
+  std::mt19937_64 generator ( seed ) ;
+  const unsigned long last = std::min ( num , size - 1 ) ;
+  for ( unsigned long i = 0 ; i < last ; ++i ) 
+  {
+    std::uniform_int_distribution<unsigned long> flat ( i , size - 1 ) ;
+    const unsigned long j = flat ( generator ) ;
+    if ( i != j ) { std::swap ( indices [ i ] , indices [ j ] ) ; }
+  }
+}
+// ============================================================================
+/*  sort the array of indices (in place) in increasing order
+ *  @param indices (UPDATE) the array of indices 
+ *  @param size    (INPUT)  the length of the array of indices 
+ */
+// ============================================================================
+void Ostap::Utils::sort 
+( unsigned long*       indices , 
+  const unsigned long  size    ) 
+{
+  if ( nullptr == indices || size < 2 ) { return ; }
+  std::sort ( indices , indices + size ) ;
+}
+// ============================================================================
+/*  random (Bernoulli) selection of indices from [0,size)
+ *  @param indices  (OUTPUT) the array of (at least) <code>size</code> elements 
+ *  @param size     (INPUT)  the length of the array of indices 
+ *  @param fraction (INPUT)  the probability to select the index 
+ *  @param seed     (INPUT)  the seed for the random number generator 
+ *  @return number of selected indices 
+ */
+// ============================================================================
+unsigned long Ostap::Utils::select
+( unsigned long*       indices  , 
+  const unsigned long  size     , 
+  const double         fraction , 
+  const unsigned long  seed     ) 
+{
+  if ( nullptr == indices || 0 == size || !( 0 < fraction ) ) { return 0 ; }
+  //
+  std::mt19937_64                        generator ( seed ) ;
+  std::uniform_real_distribution<double> flat      ( 0.0 , 1.0 ) ;
+  unsigned long selected = 0 ;
+  for ( unsigned long i = 0 ; i < size ; ++i ) 
+  { if ( flat ( generator ) < fraction ) { indices [ selected++ ] = i ; } }
+  //
+  return selected ;
+}
+// ============================================================================
+/*  fill the target dataset (e.g. the empty clone of the source) 
+ *  with the entries of the source dataset, where the values of the 
+ *  specified variables are taken from the flat (N,k) block of doubles
+ *  @param source  (INPUT)  the source dataset 
+ *  @param target  (UPDATE) the target dataset 
+ *  @param vars    (INPUT)  the variables (k) to be replaced 
+ *  @param block   (INPUT)  the (N,k) block of values 
+ *  @param size    (INPUT)  number of rows (N) in the block 
+ *  @return number of added entries 
+ */
+// ============================================================================
+unsigned long Ostap::Utils::fill
+( const RooAbsData*    source  , 
+  RooAbsData*          target  , 
+  const RooArgList&    vars    , 
+  const double*        block   , 
+  const unsigned long  size    ) 
+{
+  if ( nullptr == source || nullptr == target || nullptr == block ) { return 0 ; }
+  //
+  const RooArgSet* tentry = target->get() ;
+  if ( nullptr == tentry ) { return 0 ; }
+  //
+  // (non-owning) view to the variables of the target 
+  RooArgSet row ( *tentry ) ;
+  //
+  std::vector<RooAbsRealLValue*> lvars ;
+  lvars.reserve ( vars.getSize() ) ;
+  for ( int j = 0 ; j < vars.getSize() ; ++j ) 
+  {
+    RooAbsRealLValue* v = dynamic_cast<RooAbsRealLValue*> ( vars.at ( j ) ) ;
+    if ( nullptr == v ) { return 0 ; }
+    lvars.push_back ( v ) ;
+  }
+  //
+  const unsigned long k     = lvars.size() ;
+  const unsigned long num   = std::min ( size , (unsigned long) source->numEntries() ) ;
+  unsigned long       added = 0 ;
+  for ( unsigned long i = 0 ; i < num ; ++i ) 
+  {
+    const RooArgSet* entry = source->get ( i ) ;
+    if ( nullptr == entry ) { continue ; }
+    row.assignValueOnly ( *entry ) ;
+    const double* values = block + i * k ;
+    for ( unsigned long j = 0 ; j < k ; ++j ) { lvars [ j ]->setVal ( values [ j ] ) ; }
+    target->add ( row , source->weight() ) ;
+    ++added ;
+  }
+  //
+  return added ;
+}
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
@@ -0,0 +1,86 @@
+// ============================================================================
+// Include files 
+// ============================================================================
+// STD&STL
+// ============================================================================
+#include <limits>
+// ============================================================================
+// ROOT/RooFit
+// ============================================================================
+#include "RooRealVar.h"
+#include "RooAbsCollection.h"
+// ============================================================================
+// Ostap
+// ============================================================================
+#include "Ostap/RooFitUtils.h"
+#include "Ostap/Iterator.h"
+// ============================================================================
+/** @file 
+ *  Implementation file for functions from the file Ostap/RooFitUtils.h
+ *  @see Ostap::Utils::valueWithError
+ *  @see Ostap::Utils::valueAndError
+ *  @see Ostap::Utils::valuesErrors
+ */
+// ============================================================================
+/*  get the value with error for the RooRealVar (in a single call)
+ *  - the error is ignored for the constant variables 
+ *  @param var (INPUT) the variable 
+ *  @return value with error 
+ */
+// ============================================================================
+Ostap::Math::ValueWithError 
+Ostap::Utils::valueWithError ( const RooRealVar& var ) 
+{
+  const double v = var.getVal() ;
+  if ( var.isConstant() ) { return Ostap::Math::ValueWithError ( v ) ; }
+  const double e = var.getError () ;
+  return Ostap::Math::ValueWithError ( v , e * e ) ;
+}
+// ============================================================================
+/*  get the value and the error of the variable (in a single call)
+ *  - the error is taken from RooRealVar and it is zero otherwise 
+ *  @param var (INPUT) the variable 
+ *  @return (value,error) pair 
+ */
+// ============================================================================
+std::pair<double,double> 
+Ostap::Utils::valueAndError ( const RooAbsReal& var ) 
+{
+  const RooRealVar* v = dynamic_cast<const RooRealVar*> ( &var ) ;
+  return std::make_pair ( var.getVal() , v ? v->getError() : 0.0 ) ;
+}
+// ============================================================================
+/*  get the values and errors of all variables from the collection 
+ *  (in a single loop)
+ *  @param vars   (INPUT)  the collection of variables 
+ *  @param values (OUTPUT) the array of values 
+ *  @param errors (OUTPUT) the array of errors 
+ *  @param size   (INPUT)  the length of arrays 
+ *  @return number of processed elements 
+ */
+// ============================================================================
+unsigned long Ostap::Utils::valuesErrors 
+( const RooAbsCollection& vars   , 
+  double*                 values , 
+  double*                 errors , 
+  const unsigned long     size   ) 
+{
+  if ( nullptr == values || nullptr == errors ) { return 0 ; }
+  //
+  Ostap::Utils::Iterator iter ( vars ) ;
+  unsigned long  index = 0 ;
+  RooAbsArg*     arg   = 0 ;
+  while ( index < size && ( arg = (RooAbsArg*) iter.next() ) ) 
+  {
+    const RooAbsReal* r = dynamic_cast<const RooAbsReal*> ( arg ) ;
+    const RooRealVar* v = dynamic_cast<const RooRealVar*> ( arg ) ;
+    values [ index ] = r ? r->getVal   () : std::numeric_limits<double>::quiet_NaN() ;
+    errors [ index ] = v ? v->getError () : 0.0 ;
+    ++index ;
+  }
+  //
+  return index ;
+}
+// ============================================================================
+//                                                                      The END 
+// ============================================================================
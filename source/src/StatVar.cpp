@@ -8,6 +8,8 @@
 #include <algorithm>
 #include <set>
 #include <random>
+#include <utility>
+#include <vector>
 // ============================================================================
 // Ostap
 // ============================================================================
@@ -107,6 +109,91 @@ namespace
     return empty ? 0 : sumw *  sumw / sumw2 ; // RETURN 
   }
   // ==========================================================================
+  /** @class Moments4
+   *  Single-pass accumulator for the weighted central moments up to 4th order.
+   *  The power sums are accumulated for the values shifted by the first value:
+   *  it suppresses the cancellations in the central moments and, 
+   *  unlike the online (Welford) updates, it does not divide by 
+   *  the running sum of weights, that can vanish for negative (s)weights
+   */
+  class Moments4
+  {
+  public:
+    // ========================================================================
+    /// add the value with the weight 
+    inline void add ( const long double x , const long double w ) 
+    {
+      if ( m_empty ) { m_shift = x ; m_empty = false ; }
+      const long double dx  = x - m_shift ;
+      const long double dx2 = dx * dx     ;
+      m_sumw  += w ;
+      m_sumw2 += w * w ;
+      m_s1    += w * dx        ;
+      m_s2    += w * dx2       ;
+      m_s3    += w * dx2 * dx  ;
+      m_s4    += w * dx2 * dx2 ;
+    }
+    // ========================================================================
+    /// add another accumulator (e.g. from the parallel processing)
+    inline void add ( const Moments4& other ) 
+    {
+      if      ( other.m_empty ) { return ; }
+      else if (       m_empty ) { *this = other ; return ; }
+      // re-center the power sums of other accumulator to our shift 
+      const long double h  = other.m_shift - m_shift ;
+      const long double h2 = h  * h ;
+      const long double h3 = h2 * h ;
+      const long double h4 = h2 * h2 ;
+      const long double t0 = other.m_sumw ;
+      const long double t1 = other.m_s1   ;
+      const long double t2 = other.m_s2   ;
+      const long double t3 = other.m_s3   ;
+      const long double t4 = other.m_s4   ;
+      m_sumw  += t0 ;
+      m_sumw2 += other.m_sumw2 ;
+      m_s1    += t1 +     h * t0 ;
+      m_s2    += t2 + 2 * h * t1 +     h2 * t0 ;
+      m_s3    += t3 + 3 * h * t2 + 3 * h2 * t1 +     h3 * t0 ;
+      m_s4    += t4 + 4 * h * t3 + 6 * h2 * t2 + 4 * h3 * t1 + h4 * t0 ;
+    }
+    // ========================================================================
+    /// no entries ?
+    bool        empty () const { return m_empty ; }
+    /// number of effective entries 
+    long double nEff  () const { return m_sumw * m_sumw / m_sumw2 ; }
+    /// 2nd central moment 
+    long double m2    () const 
+    { 
+      const long double d = m_s1 / m_sumw ;
+      return m_s2 / m_sumw - d * d ;
+    }
+    /// 3rd central moment 
+    long double m3    () const 
+    { 
+      const long double d = m_s1 / m_sumw ;
+      return m_s3 / m_sumw - 3 * d * m_s2 / m_sumw + 2 * d * d * d ;
+    }
+    /// 4th central moment 
+    long double m4    () const 
+    { 
+      const long double d  = m_s1 / m_sumw ;
+      const long double d2 = d * d ;
+      return m_s4 / m_sumw - 4 * d * m_s3 / m_sumw + 6 * d2 * m_s2 / m_sumw - 3 * d2 * d2 ;
+    }
+    // ========================================================================
+  private:
+    // ========================================================================
+    bool        m_empty { true } ;
+    long double m_shift { 0    } ;
+    long double m_sumw  { 0    } ;
+    long double m_sumw2 { 0    } ;
+    long double m_s1    { 0    } ;
+    long double m_s2    { 0    } ;
+    long double m_s3    { 0    } ;
+    long double m_s4    { 0    } ;
+    // ========================================================================
+  } ;
+  // ==========================================================================
   /** calculate the moment of order "order" relative to the center "center"
    *  @param  tree   (INPUT) input tree 
    *  @param  expr   (INPUT) expression  (must  be valid TFormula!)
@@ -406,19 +493,11 @@ namespace
     const unsigned long nEntries = std::min ( last , (unsigned long) tree.GetEntries() ) ;
     if ( last <= first  ) { return 0 ;  } // RETURN ???    
     //
-    // calculate mean value
-    const long double mean = _moment1_  ( tree , var , cuts , 1 , 0 , first , last ) ;
-    //
     Ostap::Utils::Notifier notify ( &tree , &var , cuts ) ;
     const bool with_cuts = nullptr != cuts ? true : false ;
     //
-    long double          mom   = 0    ;
-    long double          sumw  = 0    ; // sum of weights 
-    // for uncertainty:
-    long double          sumw2 = 0    ; // sum of weights^2
-    long double          m2    = 0    ; // moment of 2
-    bool                 empty = true ;
-    std::vector<double>  results {} ;
+    Moments4            moms {} ; // single pass 
+    std::vector<double> results {} ;
     for ( unsigned long entry = first ; entry < nEntries ; ++entry ) 
     {      
       long ievent = tree.GetEntryNumber ( entry ) ;
@@ -432,30 +511,19 @@ namespace
       if  ( !w ) { continue ; }                            // ATTENTION!
       //
       var.evaluate ( results ) ;
-      for ( const long double r : results ) 
-      {
-        const long double dx =  r -  mean ;
-        //
-        mom   += w * std::pow ( dx , 3 ) ;
-        sumw  += w     ;
-        // for uncertainty:
-        sumw2 += w * w ;
-        m2    += w * std::pow ( dx , 2 ) ;
-        //
-        empty  = false ;
-      }
+      for ( const long double r : results ) { moms.add ( r , w ) ; }
     }
     //
-    if  (  empty ) { return 0 ; }
+    if  ( moms.empty() ) { return 0 ; }
     //
     // number of effective entries:
-    const long double n = sumw * sumw / sumw2 ;
+    const long double n = moms.nEff () ;
     //
-    long double v = mom / sumw ;
+    long double v = moms.m3 () ;
     /// correct O(1/n) bias  for 3rd moment 
     v *=  n * n / ( ( n - 1  ) * ( n - 2 ) ) ; 
     //
-    m2 /= sumw  ;
+    const long double m2 = moms.m2 () ;
     v  /= std::pow ( m2 , 1.5 ) ;
     //
     long double c2 = 6  ;
@@ -486,18 +554,10 @@ namespace
     const unsigned long nEntries = std::min ( last , (unsigned long) tree.GetEntries() ) ;
     if ( last <= first  ) { return 0 ;  } // RETURN ???    
     //
-    // calculate mean value
-    const long double mean = _moment1_  ( tree , var , cuts , 1 , 0 , first , last ) ;
-    //
     Ostap::Utils::Notifier notify ( &tree , &var , cuts ) ;
     const bool with_cuts = nullptr != cuts ? true : false ;
     //
-    long double         mom   = 0    ;
-    long double         sumw  = 0    ; // sum of weights 
-    // for uncertainty:
-    long double         sumw2 = 0    ; // sum of weights^2
-    long double         m2    = 0    ; // moment of 2
-    bool                empty = true ;
+    Moments4            moms {} ; // single pass 
     std::vector<double> results {} ;
     for ( unsigned long entry = first ; entry < nEntries ; ++entry ) 
     {      
@@ -512,27 +572,16 @@ namespace
       if  ( !w ) { continue ; }                            // ATTENTION!
       //
       var.evaluate ( results ) ;
-      for ( const long double r : results ) 
-      { 
-        const long double dx =  r -  mean ;
-        //
-        mom   += w * std::pow ( dx , 4 ) ;
-        sumw  += w     ;
-        // for uncertainty:
-        sumw2 += w * w ;
-        m2    += w * std::pow ( dx , 2 ) ;
-        //
-        empty  = false ;
-      } 
+      for ( const long double r : results ) { moms.add ( r , w ) ; }
     }
     //
-    if ( empty ) { return 0 ; } // RETURN
+    if ( moms.empty() ) { return 0 ; } // RETURN
     //
     // number of effective entries:
-    const long double n = sumw * sumw / sumw2 ;
+    const long double n = moms.nEff () ;
     //
-    long double v = mom / sumw ;
-    m2 /= sumw  ; // second order moment
+    long double       v  = moms.m4 () ;
+    const long double m2 = moms.m2 () ; // second order moment
     /// correct for O(1/n) bias:
     const double n0 =  ( n - 1 ) * ( n - 2 ) * ( n - 3 ) ;
     const double n1 =  n * ( n * n - 2 * n +  3 ) / n0   ;
@@ -1288,6 +1337,68 @@ Ostap::StatVar::statVar
   return result ;
 }
 // ============================================================================
+/*  build statistic for the <code>expressions</code> (in a single loop)
+ *  @param data        (INPUT)  the data 
+ *  @param result      (UPDATE) the output statistics for specified expressions 
+ *  @param expressions (INPUT)  the list of  expressions
+ *  @param cuts        (INPUT)  the selection criteria 
+ *  @param first       (INPUT)  the first entry to process 
+ *  @param last        (INPUT)  the last entry to process (not including!)
+ *  @return number of processed entries 
+ */
+// ============================================================================
+unsigned long Ostap::StatVar::statVars
+( const RooAbsData*                       data        ,  
+  std::vector<Ostap::StatVar::Statistic>& result      ,  
+  const std::vector<std::string>&         expressions ,
+  const std::string&                      cuts        ,
+  const unsigned long                     first       ,
+  const unsigned long                     last        ) 
+{
+  //
+  const unsigned int N = expressions.size() ;
+  //
+  result.resize ( N ) ; 
+  for ( auto& r : result ) { r.reset () ; }
+  //
+  if ( 0 == data || last <= first ) { return 0 ; }  // RETURN
+  if ( expressions.empty()        ) { return 0 ; }  // RETURN  
+  //
+  typedef std::unique_ptr<RooFormulaVar> URF ;
+  std::vector<URF> formulas ; formulas.reserve ( N ) ;
+  for ( const auto& e : expressions  ) { formulas.push_back ( make_formula ( e , *data ) ) ; }
+  //
+  const URF selection { make_formula ( cuts , *data , true ) } ;
+  //
+  const bool          weighted = data->isWeighted() ;
+  const unsigned long the_last = std::min ( last , (unsigned long) data->numEntries() ) ;
+  //
+  unsigned long processed = 0 ;
+  for ( unsigned long entry = first ; entry < the_last ; ++entry )
+  {
+    //
+    const RooArgSet* vars = data->get( entry ) ;
+    if ( nullptr == vars  ) { break    ; }                      // BREAK 
+    //
+    // apply cuts:
+    const long double wc = selection ? selection -> getVal() : 1.0L ;
+    if ( !wc ) { continue ; }                                   // CONTINUE  
+    // apply weight:
+    const long double wd = weighted  ? data->weight()        : 1.0L ;
+    if ( !wd ) { continue ; }                                   // CONTINUE    
+    // cuts & weight:
+    const long double w  = wd *  wc ;
+    if ( !w  ) { continue ; }                                   // CONTINUE        
+    //
+    for ( unsigned int i = 0 ; i < N ; ++i ) 
+    { result [ i ].add ( formulas [ i ]->getVal () , w ) ; }
+    //
+    ++processed ;
+  }
+  //
+  return processed ;
+}
+// ============================================================================
 /*  calculate the covariance of two expressions
  *  @param tree  (INPUT)  the input tree
  *  @param exp1  (INPUT)  the first  expresiion
@@ -2139,16 +2250,7 @@ Ostap::StatVar::skewness
   const std::unique_ptr<RooFormulaVar> expression { make_formula ( expr , data        ) } ;
   const std::unique_ptr<RooFormulaVar> cut        { make_formula ( cuts , data , true ) } ;
   //
-  const long double mu =
-    _moment_ ( data ,  *expression , cut.get() , 1  , 0 , first ,  the_last , cutrange );
-  //
-  long double mom   = 0 ;
-  long double sumw  = 0 ; // sum of weights 
-  // for uncertainty:
-  long double sumw2 = 0 ; // sum of weights^2
-  long double m2    = 0 ; // moment of 2
-  //
-  bool        empty = true ;
+  Moments4 moms {} ; // single pass 
   //
   for ( unsigned long entry = first ; entry < the_last ; ++entry )
   {
@@ -2166,26 +2268,18 @@ Ostap::StatVar::skewness
     const long double w  = wd *  wc ;
     if ( !w  ) { continue ; }                                   // CONTINUE        
     //
-    const double dx = expression->getVal() - mu ;
-    //
-    mom   += w * std::pow ( dx , 3 ) ;
-    sumw  += w     ;
-    // for uncertainty:
-    sumw2 += w * w ;
-    m2    += w * std::pow ( dx , 2 ) ;
-    //
-    empty  = false ;
+    moms.add ( expression->getVal() , w ) ;
   }
   //
-  if ( empty ) {  return 0 ; }
+  if ( moms.empty() ) {  return 0 ; }
   // number of effective entries:
-  const long double n = sumw * sumw / sumw2 ;
+  const long double n = moms.nEff () ;
   //
-  long double v = mom / sumw ;
+  long double v = moms.m3 () ;
   /// correct O(1/n) bias  for 3rd moment 
   v *=  n * n / ( ( n - 1  ) * ( n - 2 ) ) ; 
   //
-  m2 /= sumw  ;
+  const long double m2 = moms.m2 () ;
   v  /= std::pow ( m2 , 1.5 ) ;
   //
   long double c2 = 6  ;
@@ -2225,16 +2319,7 @@ Ostap::StatVar::kurtosis
   const std::unique_ptr<RooFormulaVar> expression { make_formula ( expr , data        ) } ;
   const std::unique_ptr<RooFormulaVar> cut        { make_formula ( cuts , data , true ) } ;
   //
-  const long double mu =
-    _moment_ ( data ,  *expression , cut.get() , 1  , 0 , first ,  the_last , cutrange );
-  //
-  long double mom   = 0 ;
-  long double sumw  = 0 ; // sum of weights 
-  // for uncertainty:
-  long double sumw2 = 0 ; // sum of weights^2
-  long double m2    = 0 ; // moment of 2
-  //
-  bool        empty = true ;
+  Moments4 moms {} ; // single pass 
   //
   for ( unsigned long entry = first ; entry < the_last ; ++entry )
   {
@@ -2252,24 +2337,16 @@ Ostap::StatVar::kurtosis
     const long double w  = wd *  wc ;
     if ( !w  ) { continue ; }                                   // CONTINUE        
     //
-    const double dx = expression->getVal() - mu ;
-    //
-    mom   += w * std::pow ( dx , 4 ) ;
-    sumw  += w     ;
-    // for uncertainty:
-    sumw2 += w * w ;
-    m2    += w * std::pow ( dx , 2 ) ;
-    //
-    empty  = false ;
+    moms.add ( expression->getVal() , w ) ;
   }
   //
-  if ( empty ) { return 0 ; } // RETURN
+  if ( moms.empty() ) { return 0 ; } // RETURN
   //
   // number of effective entries:
-  const long double n = sumw * sumw / sumw2 ;
+  const long double n = moms.nEff () ;
   //
-  long double v = mom / sumw ;
-  m2 /= sumw  ; // second order moment
+  long double       v  = moms.m4 () ;
+  const long double m2 = moms.m2 () ; // second order moment
   /// correct for O(1/n) bias:
   const double n0 =  ( n - 1 ) * ( n - 2 ) * ( n - 3 ) ;
   const double n1 =  n * ( n * n - 2 * n +  3 ) / n0   ;
@@ -2857,18 +2934,13 @@ Ostap::Math::ValueWithError Ostap::StatVar::skewness
   const std::string&   cuts  ) 
 {
   //
-  const bool no_cuts =  trivial (  cuts ) ;
+  const bool no_cuts = trivial (  cuts ) ;
   //
-  /// get the mean-value  (1-loop) 
-  const long double mu   = get_moment ( frame , 1 , expr , 0.0 , cuts ) ;
-  //  
   /// define the temporary columns 
   const std::string var     = Ostap::tmp_name ( "v_"   , expr ) ;
   const std::string bcut    = Ostap::tmp_name ( "b_"   , cuts ) ;
   const std::string weight  = Ostap::tmp_name ( "w_"   , cuts ) ;
-  const std::string weight2 = Ostap::tmp_name ( "w2_"  , cuts ) ;
-  const std::string vmom3   = Ostap::tmp_name ( "m3_"  , expr ) ;
-  const std::string vmom2   = Ostap::tmp_name ( "m2_"  , expr ) ;
+  const std::string vw      = Ostap::tmp_name ( "vw_"  , expr ) ;
   //
   // decorate the frame 
   auto t = frame
@@ -2876,42 +2948,27 @@ Ostap::Math::ValueWithError Ostap::StatVar::skewness
     .Filter ( bcut    )    
     .Define ( var     ,                   "1.0*(" + expr + ")" ) 
     .Define ( weight  , no_cuts ? "1.0" : "1.0*(" + cuts + ")" ) 
-    .Define ( weight2 , [] ( double w ) { return w * w ; } , { weight } ) 
-    // 
-    .Define ( vmom3   , [mu]( double v , double w )->double {
-        const long double lv = v ;
-        const long double lw = w ;
-        return lw ? lw * std::pow ( lv - mu , 3 ) : 0.0 ;
-      } , { var , weight } ) 
-    //
-    .Define ( vmom2   , [mu]( double v , double w )->double {
-        const long double lv = v ;
-        const long double lw = w ;
-        return lw ? lw * std::pow ( lv - mu , 2 ) : 0.0 ;
-      } , { var , weight } ) ;
-  //
-  auto _mom3  = t.Reduce ( std::plus<double>() , vmom3   ) ;
-  auto _mom2  = t.Reduce ( std::plus<double>() , vmom2   ) ;
-  auto _sumw  = t.Reduce ( std::plus<double>() , weight  ) ;
-  auto _sumw2 = t.Reduce ( std::plus<double>() , weight2 ) ;
+    .Define ( vw      , [] ( double v , double w ) { return std::make_pair ( v , w ) ; } , { var , weight } ) ;
   //
-  const long double sumw  = *_sumw ;
-  
+  /// single loop over the frame 
+  auto _moms = t.Aggregate 
+    ( [] ( Moments4& m , const std::pair<double,double>& p ) 
+      { if ( p.second ) { m.add ( p.first , p.second ) ; } } , 
+      [] ( std::vector<Moments4>& ms ) 
+      { for ( std::size_t i = 1 ; i < ms.size() ; ++i ) { ms [ 0 ].add ( ms [ i ] ) ; } } , 
+      vw , Moments4 () ) ;
   //
-  if ( !sumw ) { return  0 ; }  // RETURN 
-  //
-  const long double mom3  = *_mom3  ; 
-  const long double sumw2 = *_sumw2 ;
-  long double       mom2  = *_mom2  ;
+  const Moments4& moms = *_moms ;
+  if ( moms.empty() ) { return  0 ; }  // RETURN 
   //
   // number of effective entries:
-  const long double n = sumw * sumw / sumw2 ;
+  const long double n = moms.nEff () ;
   //
-  long double v = mom3 / sumw ;
+  long double v = moms.m3 () ;
   /// correct O(1/n) bias  for 3rd moment 
   v *=  n * n / ( ( n - 1  ) * ( n - 2 ) ) ; 
   //
-  mom2 /= sumw  ;
+  const long double mom2 = moms.m2 () ;
   v  /= std::pow ( mom2 , 1.5 ) ;
   //
   long double c2 = 6  ;
@@ -2936,17 +2993,13 @@ Ostap::Math::ValueWithError Ostap::StatVar::kurtosis
   const std::string&   cuts  )
 {
   //
-  const bool no_cuts = trivial (  cuts ) ; 
+  const bool no_cuts = trivial (  cuts ) ;
   //
-  /// get the mean-value  (1-loop) 
-  const long double mu   = get_moment ( frame , 1 , expr , 0.0 , cuts ) ;
-  //  
+  /// define the temporary columns 
   const std::string var     = Ostap::tmp_name ( "v_"   , expr ) ;
   const std::string bcut    = Ostap::tmp_name ( "b_"   , cuts ) ;
   const std::string weight  = Ostap::tmp_name ( "w_"   , cuts ) ;
-  const std::string weight2 = Ostap::tmp_name ( "w2_"  , cuts ) ;
-  const std::string vmom4   = Ostap::tmp_name ( "m4_"  , expr ) ;
-  const std::string vmom2   = Ostap::tmp_name ( "m2_"  , expr ) ;
+  const std::string vw      = Ostap::tmp_name ( "vw_"  , expr ) ;
   //
   // decorate the frame 
   auto t = frame
@@ -2954,40 +3007,24 @@ Ostap::Math::ValueWithError Ostap::StatVar::kurtosis
     .Filter ( bcut    )    
     .Define ( var     ,                   "1.0*(" + expr + ")" ) 
     .Define ( weight  , no_cuts ? "1.0" : "1.0*(" + cuts + ")" ) 
-    .Define ( weight2 , [] ( double w ) { return w * w ; } , { weight } ) 
-    // 
-    .Define ( vmom4   , [mu]( double v , double w )->double {
-        const long double lv = v ;
-        const long double lw = w ;
-        return lw ? lw * std::pow ( lv - mu , 4 ) : 0.0 ;
-      } , { var , weight } ) 
-    //
-    .Define ( vmom2   , [mu]( double v , double w )->double {
-        const long double lv = v ;
-        const long double lw = w ;
-        return lw ? lw * std::pow ( lv - mu , 2 ) : 0.0 ;
-      } , { var , weight } ) ;
-  //
-  //
-  auto _mom4  = t.Reduce ( std::plus<double>() , vmom4   ) ;
-  auto _mom2  = t.Reduce ( std::plus<double>() , vmom2   ) ;
-  auto _sumw  = t.Reduce ( std::plus<double>() , weight  ) ;
-  auto _sumw2 = t.Reduce ( std::plus<double>() , weight2 ) ;
+    .Define ( vw      , [] ( double v , double w ) { return std::make_pair ( v , w ) ; } , { var , weight } ) ;
   //
+  /// single loop over the frame 
+  auto _moms = t.Aggregate 
+    ( [] ( Moments4& m , const std::pair<double,double>& p ) 
+      { if ( p.second ) { m.add ( p.first , p.second ) ; } } , 
+      [] ( std::vector<Moments4>& ms ) 
+      { for ( std::size_t i = 1 ; i < ms.size() ; ++i ) { ms [ 0 ].add ( ms [ i ] ) ; } } , 
+      vw , Moments4 () ) ;
   //
-  const long double sumw  = *_sumw ; 
-  //
-  if ( !sumw ) { return  0 ; }  // RETURN 
-  //
-  const long double mom4  = *_mom4  ; 
-  const long double sumw2 = *_sumw2 ;
-  long double       mom2  = *_mom2  ; 
+  const Moments4& moms = *_moms ;
+  if ( moms.empty() ) { return  0 ; }  // RETURN 
   //
   // number of effective entries:
-  const long double n = sumw * sumw / sumw2 ;
+  const long double n = moms.nEff () ;
   //
-  long double v = mom4 / sumw ;
-  mom2 /= sumw  ; // second order moment
+  long double       v    = moms.m4 () ;
+  const long double mom2 = moms.m2 () ; // second order moment
   /// correct for O(1/n) bias:
   const double n0 =  ( n - 1 ) * ( n - 2 ) * ( n - 3 ) ;
   const double n1 =  n * ( n * n - 2 * n +  3 ) / n0   ;
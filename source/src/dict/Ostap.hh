@@ -19,6 +19,7 @@
 #include "Ostap/Choose.h"
 #include "Ostap/Clenshaw.h"
 #include "Ostap/Combine.h"
+#include "Ostap/DataUtils.h"
 #include "Ostap/Digit.h"
 #include "Ostap/EigenSystem.h"
 #include "Ostap/Error2Exception.h"
@@ -71,6 +72,7 @@
 #include "Ostap/PySelector.h"
 #include "Ostap/PySelectorWithCuts.h"
 #include "Ostap/Polarization.h"
+#include "Ostap/RooFitUtils.h"
 #include "Ostap/SFactor.h"
 #include "Ostap/StatEntity.h"
 #include "Ostap/StatVar.h"